@@ -48,11 +48,11 @@ class GaussianProcess(_random_process.RandomProcess[_InputType, _OutputType]):
     >>> x = np.linspace(-1, 1, 5)[:, None]
     >>> np.random.seed(42)
     >>> gp.sample(x)
-    array([[-0.35187364],
-           [-0.41301096],
-           [-0.65094306],
-           [-0.56817194],
-           [ 0.01173088]])
+    array([[0.49671415],
+           [0.37332048],
+           [0.39027118],
+           [0.79578772],
+           [1.2342192 ]])
     >>> gp.cov(x)
     array([[1.        , 0.8824969 , 0.60653066, 0.32465247, 0.13533528],
            [0.8824969 , 1.        , 0.8824969 , 0.60653066, 0.32465247],
@@ -1,13 +1,14 @@
-"""This module implements binary arithmetic operators between pairs of random
-variables."""
+"""This module implements unary arithmetic operators on random variables and binary
+arithmetic operators between pairs of random variables."""
 
 import operator
-from typing import Any, Callable, Dict, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import numpy as np
 
 import probnum.linops as _linear_operators
 from probnum import utils as _utils
+from probnum.type import ShapeType
 
 from ._constant import Constant as _Constant
 from ._normal import Normal as _Normal
@@ -51,6 +52,46 @@ def pow_(rv1: Any, rv2: Any) -> _RandomVariable:
     return _apply(_pow_fns, rv1, rv2)
 
 
+def neg(rv: _RandomVariable) -> _RandomVariable:
+    if _is_signed_real_dtype(rv.dtype):
+        return _affine_transform(rv, scale=-1, shift=0)
+
+    return _RandomVariable(
+        shape=rv.shape,
+        dtype=rv.dtype,
+        random_state=_utils.derive_random_seed(rv.random_state),
+        sample=lambda size: -rv.sample(size=size),
+        in_support=lambda x: rv.in_support(-x),
+        mode=lambda: -rv.mode,
+        median=lambda: -rv.median,
+        mean=lambda: -rv.mean,
+        cov=lambda: rv.cov,
+        var=lambda: rv.var,
+        std=lambda: rv.std,
+        as_value_type=rv._as_value_type,  # pylint: disable=protected-access
+    )
+
+
+def pos(rv: _RandomVariable) -> _RandomVariable:
+    if _is_signed_real_dtype(rv.dtype):
+        return _affine_transform(rv, scale=1, shift=0)
+
+    return _RandomVariable(
+        shape=rv.shape,
+        dtype=rv.dtype,
+        random_state=_utils.derive_random_seed(rv.random_state),
+        sample=lambda size: +rv.sample(size=size),
+        in_support=lambda x: rv.in_support(+x),
+        mode=lambda: +rv.mode,
+        median=lambda: +rv.median,
+        mean=lambda: +rv.mean,
+        cov=lambda: rv.cov,
+        var=lambda: rv.var,
+        std=lambda: rv.std,
+        as_value_type=rv._as_value_type,  # pylint: disable=protected-access
+    )
+
+
 ########################################################################################
 # Operator registry
 ########################################################################################
@@ -77,15 +118,19 @@ def _apply(
     rv1: Any,
     rv2: Any,
 ) -> Union[_RandomVariable, type(NotImplemented)]:
-    # Convert arguments to random variables
-    rv1 = _asrandvar(rv1)
-    rv2 = _asrandvar(rv2)
+    # Convert arguments to random variables. Random variables, the most frequent
+    # operands, are detected without the call overhead of `asrandvar`.
+    if not isinstance(rv1, _RandomVariable):
+        rv1 = _asrandvar(rv1)
 
-    # Search specific operatir
-    key = (type(rv1), type(rv2))
+    if not isinstance(rv2, _RandomVariable):
+        rv2 = _asrandvar(rv2)
 
-    if key in op_registry:
-        res = op_registry[key](rv1, rv2)
+    # Search specific operator
+    op = op_registry.get((type(rv1), type(rv2)))
+
+    if op is not None:
+        res = op(rv1, rv2)
     else:
         res = NotImplemented
 
@@ -128,11 +173,14 @@ def _default_rv_binary_op_factory(op_fn) -> _RandomVariableBinaryOperator:
 def _make_rv_binary_op_result_shape_dtype_sample_fn(op_fn, rv1, rv2):
     sample_fn = lambda size: op_fn(rv1.sample(size), rv2.sample(size))
 
-    # Infer shape and dtype
-    infer_sample = sample_fn(())
+    # Infer shape and dtype by applying the operator to placeholder values once,
+    # instead of drawing (and discarding) a sample from both operands
+    infer_value = np.asarray(
+        op_fn(np.ones(rv1.shape, dtype=rv1.dtype), np.ones(rv2.shape, dtype=rv2.dtype))
+    )
 
-    shape = infer_sample.shape
-    dtype = infer_sample.dtype
+    shape = infer_value.shape
+    dtype = infer_value.dtype
 
     return shape, dtype, sample_fn
 
@@ -151,19 +199,62 @@ def _generic_rv_add(rv1: _RandomVariable, rv2: _RandomVariable) -> _RandomVariab
     )
 
 
-_add_fns[(_RandomVariable, _RandomVariable)] = _generic_rv_add
-_sub_fns[(_RandomVariable, _RandomVariable)] = _default_rv_binary_op_factory(
-    operator.sub
-)
-_mul_fns[(_RandomVariable, _RandomVariable)] = _default_rv_binary_op_factory(
-    operator.mul
-)
+def _generic_rv_add_affine(
+    rv1: _RandomVariable, rv2: _RandomVariable
+) -> _RandomVariable:
+    if _is_affine_operand(rv1, rv2, allow_array=True):
+        return _affine_transform(rv1, scale=1, shift=rv2.support)
+
+    if _is_affine_operand(rv2, rv1, allow_array=True):
+        return _affine_transform(rv2, scale=1, shift=rv1.support)
+
+    return _generic_rv_add(rv1, rv2)
+
+
+def _generic_rv_sub_affine(
+    rv1: _RandomVariable, rv2: _RandomVariable
+) -> _RandomVariable:
+    if _is_affine_operand(rv1, rv2, allow_array=True):
+        return _affine_transform(rv1, scale=1, shift=-rv2.support)
+
+    if _is_affine_operand(rv2, rv1, allow_array=True):
+        return _affine_transform(rv2, scale=-1, shift=rv1.support)
+
+    return _generic_rv_sub(rv1, rv2)
+
+
+def _generic_rv_mul_affine(
+    rv1: _RandomVariable, rv2: _RandomVariable
+) -> _RandomVariable:
+    if _is_affine_operand(rv1, rv2, allow_array=False):
+        return _affine_transform(rv1, scale=rv2.support, shift=0)
+
+    if _is_affine_operand(rv2, rv1, allow_array=False):
+        return _affine_transform(rv2, scale=rv1.support, shift=0)
+
+    return _generic_rv_mul(rv1, rv2)
+
+
+def _generic_rv_truediv_affine(
+    rv1: _RandomVariable, rv2: _RandomVariable
+) -> _RandomVariable:
+    if _is_affine_operand(rv1, rv2, allow_array=False) and rv2.support != 0:
+        return _affine_transform(rv1, scale=1, shift=0, divisor=rv2.support)
+
+    return _generic_rv_truediv(rv1, rv2)
+
+
+_generic_rv_sub = _default_rv_binary_op_factory(operator.sub)
+_generic_rv_mul = _default_rv_binary_op_factory(operator.mul)
+_generic_rv_truediv = _default_rv_binary_op_factory(operator.truediv)
+
+_add_fns[(_RandomVariable, _RandomVariable)] = _generic_rv_add_affine
+_sub_fns[(_RandomVariable, _RandomVariable)] = _generic_rv_sub_affine
+_mul_fns[(_RandomVariable, _RandomVariable)] = _generic_rv_mul_affine
 _matmul_fns[(_RandomVariable, _RandomVariable)] = _default_rv_binary_op_factory(
     operator.matmul
 )
-_truediv_fns[(_RandomVariable, _RandomVariable)] = _default_rv_binary_op_factory(
-    operator.truediv
-)
+_truediv_fns[(_RandomVariable, _RandomVariable)] = _generic_rv_truediv_affine
 _floordiv_fns[(_RandomVariable, _RandomVariable)] = _default_rv_binary_op_factory(
     operator.floordiv
 )
@@ -176,6 +267,213 @@ _pow_fns[(_RandomVariable, _RandomVariable)] = _default_rv_binary_op_factory(
 )
 
 
+########################################################################################
+# Generic Random Variable - Constant Arithmetic (Affine Transformations)
+########################################################################################
+
+
+class _AffineTransformedRandomVariable(_RandomVariable):
+    """Random variable :math:`aX / c + b` obtained by scaling, dividing and shifting a
+    random variable :math:`X` by constants.
+
+    Instances should be created via :func:`_affine_transform`, which collapses chains
+    of scalings and shifts into a single instance storing the accumulated scale and
+    shift. Sampling from the result hence evaluates the affine map in one pass,
+    independent of the length of the chain of operations. Divisions are stored
+    separately from the scale, such that they are evaluated by true division.
+
+    Parameters
+    ----------
+    base :
+        Random variable :math:`X` which is transformed.
+    scale :
+        Scalar scale :math:`a`.
+    shift :
+        Shift :math:`b`. Must either be a scalar or have the same shape as ``base``.
+    divisor :
+        Scalar divisor :math:`c`. If ``None``, no division is performed.
+    dtype :
+        Data type of the transformed random variable.
+    """
+
+    def __init__(
+        self,
+        base: _RandomVariable,
+        scale: Union[int, float, np.ndarray],
+        shift: Union[int, float, np.ndarray],
+        divisor: Optional[Union[int, float, np.ndarray]],
+        dtype: np.dtype,
+    ):
+        self._base = base
+        self._scale = scale
+        self._shift = shift
+        self._divisor = divisor
+
+        self._scale_is_one = bool(self._scale == 1)
+        self._shift_is_zero = bool(np.all(self._shift == 0))
+
+        super().__init__(
+            shape=base.shape,
+            dtype=dtype,
+            random_state=_utils.derive_random_seed(base.random_state),
+            sample=self._sample,
+            in_support=self._in_support if self._scale != 0 else None,
+            mode=lambda: self._transform(self._base.mode),
+            median=lambda: self._transform(self._base.median),
+            mean=lambda: self._transform(self._base.mean),
+            cov=lambda: self._rescale(self._base.cov, self._scale ** 2, power=2),
+            var=lambda: self._rescale(self._base.var, self._scale ** 2, power=2),
+            std=lambda: self._rescale(self._base.std, np.abs(self._scale), power=1),
+            as_value_type=base._as_value_type,  # pylint: disable=protected-access
+        )
+
+    def _transform(self, x: np.ndarray) -> np.ndarray:
+        x = x * self._scale
+
+        if self._divisor is not None:
+            x = x / self._divisor
+
+        return x + self._shift
+
+    def _rescale(
+        self, x: np.ndarray, factor: Union[int, float, np.ndarray], power: int
+    ) -> np.ndarray:
+        # Scales second (`power=2`) or first (`power=1`) order moments, which are
+        # invariant to the sign of the divisor
+        x = x * factor
+
+        if self._divisor is not None:
+            x = x / np.abs(self._divisor) ** power
+
+        return x
+
+    def _sample(self, size: ShapeType) -> np.ndarray:
+        base_samples = self._base.sample(size)
+
+        # Pure shifts only need a single pass over the samples
+        if self._scale_is_one and self._divisor is None:
+            return np.add(base_samples, self._shift, dtype=self.dtype)
+
+        samples = base_samples
+
+        if not self._scale_is_one:
+            samples = np.multiply(samples, self._scale, dtype=self.dtype)
+
+        if self._divisor is not None:
+            samples = np.true_divide(samples, self._divisor, dtype=self.dtype)
+
+        if not self._shift_is_zero:
+            samples += self._shift
+
+        return samples
+
+    def _in_support(self, x: np.ndarray) -> bool:
+        x = x - self._shift
+
+        if self._divisor is not None:
+            x = x * self._divisor
+
+        return self._base.in_support(x / self._scale)
+
+
+def _affine_transform(
+    rv: _RandomVariable,
+    scale: Union[int, float, np.ndarray],
+    shift: Union[int, float, np.ndarray],
+    divisor: Optional[Union[int, float, np.ndarray]] = None,
+) -> _RandomVariable:
+    """Scale, divide and shift a random variable by constants, i.e. compute
+    ``rv * scale / divisor + shift``.
+
+    Nested affine transformations are collapsed and identity transformations, i.e.
+    scaling by one and shifting by zero without changing the dtype, return ``rv``
+    itself instead of wrapping it.
+    """
+    if isinstance(rv, _AffineTransformedRandomVariable):
+        # pylint: disable=protected-access
+        inner_shift = scale * rv._shift
+
+        if divisor is not None:
+            inner_shift = inner_shift / divisor
+
+        if rv._divisor is not None:
+            divisor = rv._divisor if divisor is None else divisor * rv._divisor
+
+        scale, shift = scale * rv._scale, inner_shift + shift
+        rv = rv._base
+
+    dtype = _affine_result_dtype(rv, scale, shift, divisor)
+
+    if (
+        dtype == rv.dtype
+        and scale == 1
+        and np.all(shift == 0)
+        and (divisor is None or divisor == 1)
+    ):
+        return rv
+
+    return _AffineTransformedRandomVariable(
+        rv, scale=scale, shift=shift, divisor=divisor, dtype=dtype
+    )
+
+
+def _affine_result_dtype(
+    rv: _RandomVariable,
+    scale: Union[int, float, np.ndarray],
+    shift: Union[int, float, np.ndarray],
+    divisor: Optional[Union[int, float, np.ndarray]] = None,
+) -> np.dtype:
+    # A size-1 array with the same number of dimensions follows the same casting
+    # rules as the values of `rv`, but does not allocate memory proportional to size
+    values = np.ones((1,) * rv.ndim, dtype=rv.dtype) * scale
+
+    if divisor is not None:
+        values = values / divisor
+
+    return np.asarray(values + shift).dtype
+
+
+def _is_neutral_operand(
+    rv: _RandomVariable, constant_rv: _Constant, neutral: Union[int, float]
+) -> bool:
+    """Whether applying an operation with a neutral element ``neutral`` to ``rv`` and
+    ``constant_rv`` leaves ``rv`` unchanged, i.e. neither its shape nor its dtype nor
+    its distribution."""
+    try:
+        # Raises if broadcasting the constant against `rv` would change the shape
+        np.broadcast_to(constant_rv.support, rv.shape)
+    except ValueError:
+        return False
+
+    if np.promote_types(rv.dtype, constant_rv.dtype) != rv.dtype:
+        return False
+
+    return bool(np.all(constant_rv.support == neutral))
+
+
+def _is_affine_operand(
+    rv: _RandomVariable, constant_rv: _RandomVariable, allow_array: bool
+) -> bool:
+    """Check whether ``constant_rv`` is a real-valued constant by which ``rv`` can be
+    shifted (``allow_array=True``) or scaled (``allow_array=False``) elementwise
+    without changing its shape."""
+    if not isinstance(constant_rv, _Constant) or isinstance(rv, _Constant):
+        return False
+
+    if not (
+        _is_signed_real_dtype(rv.dtype) and _is_signed_real_dtype(constant_rv.dtype)
+    ):
+        return False
+
+    return constant_rv.ndim == 0 or (allow_array and constant_rv.shape == rv.shape)
+
+
+def _is_signed_real_dtype(dtype: np.dtype) -> bool:
+    # Equivalent to checking `np.issubdtype` against `np.signedinteger` and
+    # `np.floating`, but a single attribute lookup
+    return dtype.kind in ("i", "f")
+
+
 ########################################################################################
 # Constant - Constant Arithmetic
 ########################################################################################
@@ -209,55 +507,54 @@ _sub_fns[(_Normal, _Normal)] = _Normal._sub_normal
 ########################################################################################
 
 
-def _add_normal_constant(norm_rv: _Normal, constant_rv: _Constant) -> _Normal:
-    cov_cholesky = norm_rv.cov_cholesky if norm_rv.cov_cholesky_is_precomputed else None
-    return _Normal(
-        mean=norm_rv.mean + constant_rv.support,
-        cov=norm_rv.cov,
-        cov_cholesky=cov_cholesky,
-        random_state=_utils.derive_random_seed(
-            norm_rv.random_state, constant_rv.random_state
-        ),
-    )
-
+def _shift_normal_factory(
+    op_fn: Callable[[Any, Any], Any]
+) -> Callable[[_RandomVariable, _RandomVariable], _Normal]:
+    """Create the operator implementing the sum or difference of a normal random
+    variable and a constant, which only changes the mean of the normal random
+    variable."""
 
-_add_fns[(_Normal, _Constant)] = _add_normal_constant
-_add_fns[(_Constant, _Normal)] = _swap_operands(_add_normal_constant)
+    def _shift_normal(rv1: _RandomVariable, rv2: _RandomVariable) -> _Normal:
+        if isinstance(rv1, _Normal):
+            norm_rv, constant_rv = rv1, rv2
 
+            if _is_neutral_operand(norm_rv, constant_rv, neutral=0):
+                return norm_rv
 
-def _sub_normal_constant(norm_rv: _Normal, constant_rv: _Constant) -> _Normal:
-    cov_cholesky = norm_rv.cov_cholesky if norm_rv.cov_cholesky_is_precomputed else None
-    return _Normal(
-        mean=norm_rv.mean - constant_rv.support,
-        cov=norm_rv.cov,
-        cov_cholesky=cov_cholesky,
-        random_state=_utils.derive_random_seed(
-            norm_rv.random_state, constant_rv.random_state
-        ),
-    )
+            mean = op_fn(norm_rv.mean, constant_rv.support)
+        else:
+            constant_rv, norm_rv = rv1, rv2
+            mean = op_fn(constant_rv.support, norm_rv.mean)
 
+        cov_cholesky = (
+            norm_rv.cov_cholesky if norm_rv.cov_cholesky_is_precomputed else None
+        )
 
-_sub_fns[(_Normal, _Constant)] = _sub_normal_constant
+        return _Normal(
+            mean=mean,
+            cov=norm_rv.cov,
+            cov_cholesky=cov_cholesky,
+            random_state=_utils.derive_random_seed(rv1.random_state, rv2.random_state),
+        )
 
+    return _shift_normal
 
-def _sub_constant_normal(constant_rv: _Constant, norm_rv: _Normal) -> _Normal:
-    cov_cholesky = norm_rv.cov_cholesky if norm_rv.cov_cholesky_is_precomputed else None
-    return _Normal(
-        mean=constant_rv.support - norm_rv.mean,
-        cov=norm_rv.cov,
-        cov_cholesky=cov_cholesky,
-        random_state=_utils.derive_random_seed(
-            constant_rv.random_state, norm_rv.random_state
-        ),
-    )
 
+_add_normal_constant = _shift_normal_factory(operator.add)
+_sub_normal_constant = _shift_normal_factory(operator.sub)
 
-_sub_fns[(_Constant, _Normal)] = _sub_constant_normal
+_add_fns[(_Normal, _Constant)] = _add_normal_constant
+_add_fns[(_Constant, _Normal)] = _swap_operands(_add_normal_constant)
+_sub_fns[(_Normal, _Constant)] = _sub_normal_constant
+_sub_fns[(_Constant, _Normal)] = _sub_normal_constant
 
 
 def _mul_normal_constant(
     norm_rv: _Normal, constant_rv: _Constant
 ) -> Union[_Normal, _Constant, type(NotImplemented)]:
+    if _is_neutral_operand(norm_rv, constant_rv, neutral=1):
+        return norm_rv
+
     if constant_rv.size == 1:
         if constant_rv.support == 0:
             return _Constant(
@@ -331,6 +628,11 @@ _matmul_fns[(_Normal, _Constant)] = _matmul_normal_constant
 
 def _matmul_constant_normal(constant_rv: _Constant, norm_rv: _Normal) -> _Normal:
     if norm_rv.ndim == 1 or (norm_rv.ndim == 2 and norm_rv.shape[1] == 1):
+        if _is_diagonal_matrix(constant_rv.support) and isinstance(
+            norm_rv.cov, np.ndarray
+        ):
+            return _matmul_diagonal_normal(constant_rv, norm_rv)
+
         if norm_rv.cov_cholesky_is_precomputed:
             cov_cholesky = _utils.linalg.cholesky_update(
                 constant_rv.support @ norm_rv.cov_cholesky
@@ -355,7 +657,45 @@ def _matmul_constant_normal(constant_rv: _Constant, norm_rv: _Normal) -> _Normal
 _matmul_fns[(_Constant, _Normal)] = _matmul_constant_normal
 
 
+def _matmul_diagonal_normal(constant_rv: _Constant, norm_rv: _Normal) -> _Normal:
+    # Multiplication with a diagonal matrix scales the rows and columns of the
+    # covariance, which avoids two dense matrix-matrix products
+    diag = np.diagonal(constant_rv.support)
+
+    if norm_rv.cov_cholesky_is_precomputed:
+        # `diag[:, None] * L` is a lower-triangular square root of the covariance.
+        # Flipping the signs of its columns with negative scale factors restores a
+        # non-negative diagonal.
+        cov_cholesky = (diag[:, None] * norm_rv.cov_cholesky) * np.where(
+            diag < 0, -1, 1
+        )
+    else:
+        cov_cholesky = None
+
+    return _Normal(
+        mean=constant_rv.support @ norm_rv.mean,
+        cov=diag[:, None] * norm_rv.cov * diag[None, :],
+        cov_cholesky=cov_cholesky,
+        random_state=_utils.derive_random_seed(
+            constant_rv.random_state, norm_rv.random_state
+        ),
+    )
+
+
+def _is_diagonal_matrix(x: Any) -> bool:
+    # Comparing the number of nonzeros avoids allocating a mask of the off-diagonal
+    return (
+        isinstance(x, np.ndarray)
+        and x.ndim == 2
+        and x.shape[0] == x.shape[1]
+        and np.count_nonzero(x) == np.count_nonzero(np.diagonal(x))
+    )
+
+
 def _truediv_normal_constant(norm_rv: _Normal, constant_rv: _Constant) -> _Normal:
+    if _is_neutral_operand(norm_rv, constant_rv, neutral=1):
+        return norm_rv
+
     if constant_rv.size == 1:
         if constant_rv.support == 0:
             raise ZeroDivisionError
@@ -56,6 +56,10 @@ class Constant(_random_variable.DiscreteRandomVariable[_ValueType]):
     is to define the Dirac delta as a linear operator as is done in functional analysis.
     While related, this is not the view taken here.
 
+    Samples of a :class:`Constant` random variable are read-only views of its
+    support, which are broadcast to the requested sample size without copying. Use
+    :func:`numpy.array` to obtain a writeable copy.
+
     Examples
     --------
     >>> from probnum import randvars
@@ -73,13 +77,14 @@ class Constant(_random_variable.DiscreteRandomVariable[_ValueType]):
     ):
         if np.isscalar(support):
             support = _utils.as_numpy_scalar(support)
+        elif isinstance(support, np.ndarray):
+            # Read-only view, such that the support can neither be altered through the
+            # random variable nor is the array passed by the caller made read-only
+            support = support.view()
+            support.setflags(write=False)
 
         self._support = support
 
-        support_floating = self._support.astype(
-            np.promote_types(self._support.dtype, np.float_)
-        )
-
         super().__init__(
             shape=self._support.shape,
             dtype=self._support.dtype,
@@ -87,20 +92,29 @@ class Constant(_random_variable.DiscreteRandomVariable[_ValueType]):
             parameters={"support": self._support},
             sample=self._sample,
             in_support=lambda x: np.all(x == self._support),
-            pmf=lambda x: np.float_(1.0 if np.all(x == self._support) else 0.0),
-            cdf=lambda x: np.float_(1.0 if np.all(x >= self._support) else 0.0),
+            pmf=self._pmf,
+            cdf=self._cdf,
             mode=lambda: self._support,
-            median=lambda: support_floating,
-            mean=lambda: support_floating,
+            median=lambda: self._support_floating,
+            mean=lambda: self._support_floating,
             cov=lambda: np.zeros_like(  # pylint: disable=unexpected-keyword-arg
-                support_floating,
+                self._support_floating,
                 shape=(
                     (self._support.size, self._support.size)
                     if self._support.ndim > 0
                     else ()
                 ),
             ),
-            var=lambda: np.zeros_like(support_floating),
+            var=lambda: np.zeros_like(self._support_floating),
+        )
+
+    @cached_property
+    def _support_floating(self) -> _ValueType:
+        # Computed on demand, since constants are frequently created as operands of
+        # arithmetic operations, which only access the support. No copy is made if the
+        # support already has a floating point dtype.
+        return self._support.astype(
+            np.promote_types(self._support.dtype, np.float_), copy=False
         )
 
     @cached_property
@@ -145,9 +159,20 @@ class Constant(_random_variable.DiscreteRandomVariable[_ValueType]):
         size = _utils.as_shape(size)
 
         if size == ():
-            return self._support.copy()
-        else:
-            return np.tile(self._support, reps=size + (1,) * self.ndim)
+            return self._support
+
+        return np.broadcast_to(self._support, size + self.shape)
+
+    def _pmf(self, x: _ValueType) -> np.float_:
+        return np.where(self._all_over_value_axes(x == self._support), 1.0, 0.0)[()]
+
+    def _cdf(self, x: _ValueType) -> np.float_:
+        return np.where(self._all_over_value_axes(x >= self._support), 1.0, 0.0)[()]
+
+    def _all_over_value_axes(self, x: np.ndarray) -> np.ndarray:
+        # Reduce over the trailing axes corresponding to the shape of the random
+        # variable and broadcast over all leading (batch) axes
+        return np.all(x, axis=tuple(range(-self.ndim, 0)))
 
     # Unary arithmetic operations
 
@@ -4,6 +4,7 @@ from typing import Callable, Optional, Union
 
 import numpy as np
 import scipy.linalg
+import scipy.special
 import scipy.stats
 
 from probnum import linops
@@ -27,6 +28,9 @@ except ImportError:
 
 COV_CHOLESKY_DAMPING = 10 ** -12
 
+_LOG_SQRT_2PI = 0.5 * np.log(2.0 * np.pi)
+_LOG_2PI = np.log(2.0 * np.pi)
+
 _ValueType = Union[np.floating, np.ndarray, linops.LinearOperator]
 
 
@@ -92,8 +96,12 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
         if np.isscalar(cov_cholesky):
             cov_cholesky = _utils.as_numpy_scalar(cov_cholesky)
 
-        # Data type normalization
-        dtype = np.promote_types(mean.dtype, cov.dtype)
+        # Data type normalization. The mean and the covariance are moments, so they
+        # are converted to the moment dtype, i.e. to at least double precision. They
+        # are also made C-contiguous here once, instead of on every evaluation.
+        dtype = _random_variable.RandomVariable.infer_moment_dtype(
+            np.promote_types(mean.dtype, cov.dtype)
+        )
 
         if not np.issubdtype(dtype, np.floating):
             dtype = np.dtype(np.double)
@@ -369,18 +377,17 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
     # Unary arithmetic operations
 
     def __neg__(self) -> "Normal":
+        # Negation does not change the covariance, hence neither its Cholesky factor
         return Normal(
             mean=-self.mean,
             cov=self.cov,
+            cov_cholesky=self._cov_cholesky,
             random_state=_utils.derive_random_seed(self.random_state),
         )
 
     def __pos__(self) -> "Normal":
-        return Normal(
-            mean=+self.mean,
-            cov=self.cov,
-            random_state=_utils.derive_random_seed(self.random_state),
-        )
+        # Random variables are immutable, so there is no need for a copy
+        return self
 
     # TODO: Overwrite __abs__ and add absolute moments of normal
     # TODO: (https://arxiv.org/pdf/1209.4340.pdf)
@@ -417,6 +424,17 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
             ),
         )
 
+    @staticmethod
+    def _exp_inplace(
+        logpdf: Union[np.floating, np.ndarray]
+    ) -> Union[np.floating, np.ndarray]:
+        # The log-densities of a batch of evaluation points are a temporary array,
+        # which can be overwritten by the densities
+        if isinstance(logpdf, np.ndarray):
+            return np.exp(logpdf, out=logpdf)
+
+        return np.exp(logpdf)
+
     # Univariate Gaussians
     def _univariate_cov_cholesky(
         self, damping_factor: Optional[FloatArgType] = COV_CHOLESKY_DAMPING
@@ -426,9 +444,9 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
     def _univariate_sample(
         self, size: ShapeType = ()
     ) -> Union[np.floating, np.ndarray]:
-        sample = scipy.stats.norm.rvs(
-            loc=self.mean, scale=self.std, size=size, random_state=self.random_state
-        )
+        # Draws the same values as `scipy.stats.norm.rvs`, but avoids its per-call
+        # argument processing. The standard deviation is a cached property.
+        sample = self.mean + self.std * self.random_state.standard_normal(size=size)
 
         if np.isscalar(sample):
             sample = _utils.as_numpy_scalar(sample, dtype=self.dtype)
@@ -444,19 +462,28 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
         return np.isfinite(x)
 
     def _univariate_pdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.norm.pdf(x, loc=self.mean, scale=self.std)
+        return Normal._exp_inplace(self._univariate_logpdf(x))
 
     def _univariate_logpdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.norm.logpdf(x, loc=self.mean, scale=self.std)
+        # The univariate density and distribution functions are evaluated in closed
+        # form or via `scipy.special`, which avoids the argument processing of
+        # `scipy.stats.norm`
+        z = (x - self.mean) / self.std
+
+        return -0.5 * z * z + self._univariate_log_normalization
+
+    @cached_property
+    def _univariate_log_normalization(self) -> np.float_:
+        return -np.log(self.std) - _LOG_SQRT_2PI
 
     def _univariate_cdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.norm.cdf(x, loc=self.mean, scale=self.std)
+        return scipy.special.ndtr((x - self.mean) / self.std)
 
     def _univariate_logcdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.norm.logcdf(x, loc=self.mean, scale=self.std)
+        return scipy.special.log_ndtr((x - self.mean) / self.std)
 
     def _univariate_quantile(self, p: FloatArgType) -> np.floating:
-        return scipy.stats.norm.ppf(p, loc=self.mean, scale=self.std)
+        return self.mean + self.std * scipy.special.ndtri(p)
 
     def _univariate_entropy(self: _ValueType) -> np.float_:
         return _utils.as_numpy_scalar(
@@ -478,12 +505,28 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
         )
 
     def _dense_sample(self, size: ShapeType = ()) -> np.ndarray:
-        sample = scipy.stats.multivariate_normal.rvs(
-            mean=self.dense_mean.ravel(),
-            cov=self.dense_cov,
-            size=size,
-            random_state=self.random_state,
-        )
+        if self._dense_cov_cholesky_factor is None:
+            # Covariances which are not numerically positive definite are left to
+            # SciPy's eigendecomposition-based implementation
+            sample = scipy.stats.multivariate_normal.rvs(
+                mean=self.dense_mean.ravel(),
+                cov=self.dense_cov,
+                size=size,
+                random_state=self.random_state,
+            )
+        else:
+            # Transform standard normal samples with the cached Cholesky factor. They
+            # are drawn directly from the random state, which can also be a
+            # `np.random.Generator`.
+            stdnormal_samples = self.random_state.standard_normal(
+                size=size + (self.size,)
+            )
+
+            # Singleton dimensions are squeezed as by `multivariate_normal.rvs`
+            sample = np.squeeze(
+                self.dense_mean.ravel()
+                + stdnormal_samples @ self._dense_cov_cholesky_factor.T
+            )
 
         return sample.reshape(sample.shape[:-1] + self.shape)
 
@@ -500,21 +543,71 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
     def _dense_in_support(x: _ValueType) -> bool:
         return np.all(np.isfinite(Normal._arg_todense(x)))
 
+    @cached_property
+    def _dense_cov_cholesky_factor(self) -> Optional[np.ndarray]:
+        """Lower Cholesky factor of the dense covariance, or ``None`` if none is
+        available and the covariance is not numerically positive definite.
+
+        A Cholesky factor which is already available, e.g. because it was passed on
+        construction, is reused. Otherwise, the covariance is factorized once. The
+        factor is shared by all evaluations of the density and by the sampler."""
+        if self.cov_cholesky_is_precomputed:
+            cov_cholesky = Normal._arg_todense(self._cov_cholesky)
+
+            if np.all(np.diag(cov_cholesky) != 0):
+                return cov_cholesky
+
+        try:
+            return scipy.linalg.cholesky(self.dense_cov, lower=True)
+        except np.linalg.LinAlgError:
+            return None
+
     def _dense_pdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.multivariate_normal.pdf(
-            Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,)),
-            mean=self.dense_mean.ravel(),
-            cov=self.dense_cov,
-        )
+        return Normal._exp_inplace(self._dense_logpdf(x))
 
     def _dense_logpdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.multivariate_normal.logpdf(
-            Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,)),
-            mean=self.dense_mean.ravel(),
-            cov=self.dense_cov,
+        x = Normal._arg_todense(x)
+
+        if self._dense_cov_cholesky_factor is None:
+            # Covariances which are not numerically positive definite are left to
+            # SciPy's eigendecomposition-based implementation
+            return scipy.stats.multivariate_normal.logpdf(
+                x.reshape(x.shape[: -self.ndim] + (-1,)),
+                mean=self.dense_mean.ravel(),
+                cov=self.dense_cov,
+            )
+
+        batch_shape = x.shape[: x.ndim - self.ndim]
+        diff = (x - self.dense_mean).reshape(-1, self.size)
+
+        # The Mahalanobis distance only needs a single triangular solve with the
+        # Cholesky factor
+        whitened_diff = scipy.linalg.solve_triangular(
+            self._dense_cov_cholesky_factor, diff.T, lower=True
+        )
+
+        return (
+            self._dense_log_normalization
+            - 0.5 * np.sum(whitened_diff * whitened_diff, axis=0)
+        ).reshape(batch_shape)[()]
+
+    @cached_property
+    def _dense_log_normalization(self) -> np.float_:
+        # A Cholesky factor passed on construction is not guaranteed to have a
+        # positive diagonal, but the absolute value of its determinant is the same
+        return -0.5 * self.size * _LOG_2PI - np.sum(
+            np.log(np.abs(np.diag(self._dense_cov_cholesky_factor)))
         )
 
     def _dense_cdf(self, x: _ValueType) -> np.float_:
+        if (
+            self.size == 2
+            and self._dense_cov_cholesky_factor is not None
+            # Owen's T function is only available from SciPy 1.5 on
+            and hasattr(scipy.special, "owens_t")
+        ):
+            return self._bivariate_cdf(x)
+
         return scipy.stats.multivariate_normal.cdf(
             Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,)),
             mean=self.dense_mean.ravel(),
@@ -528,7 +621,29 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
             cov=self.dense_cov,
         )
 
+    def _bivariate_cdf(self, x: _ValueType) -> np.float_:
+        # Evaluated in closed form for all evaluation points at once instead of by
+        # SciPy's numerical integration
+        x = Normal._arg_todense(x)
+
+        batch_shape = x.shape[: x.ndim - self.ndim]
+        std = np.sqrt(np.diag(self.dense_cov))
+
+        z = (x - self.dense_mean).reshape(-1, 2) / std
+        rho = self.dense_cov[0, 1] / (std[0] * std[1])
+
+        return _bivariate_standard_normal_cdf(z[:, 0], z[:, 1], rho).reshape(
+            batch_shape
+        )[()]
+
     def _dense_var(self) -> np.ndarray:
+        if isinstance(self.cov, linops.Kronecker):
+            # The diagonal of a Kronecker product is the Kronecker product of the
+            # diagonals of its factors, so the dense covariance is not needed
+            return np.kron(
+                np.diag(self.cov.A.todense()), np.diag(self.cov.B.todense())
+            ).reshape(self.shape)
+
         return np.diag(self.dense_cov).reshape(self.shape)
 
     def _dense_entropy(self) -> np.float_:
@@ -593,12 +708,51 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
         # Draw standard normal samples
         size_sample = (n * n,) + size
 
-        stdnormal_samples = scipy.stats.norm.rvs(
-            size=size_sample, random_state=self.random_state
-        )
+        stdnormal_samples = self.random_state.standard_normal(size=size_sample)
 
         # Appendix E: Bartels, S., Probabilistic Linear Algebra, PhD Thesis 2019
         samples_scaled = linops.Symmetrize(n) @ (self.cov_cholesky @ stdnormal_samples)
 
         # TODO: can we avoid todense here and just return operator samples?
         return self.dense_mean[None, :, :] + samples_scaled.T.reshape(-1, n, n)
+
+
+def _bivariate_standard_normal_cdf(
+    h: np.ndarray, k: np.ndarray, rho: FloatArgType
+) -> np.ndarray:
+    """Cumulative distribution function of a bivariate normal distribution with
+    standard normal marginals and correlation ``rho`` with ``|rho| < 1``.
+
+    The function is evaluated in terms of Owen's T function [1]_.
+
+    References
+    ----------
+    .. [1] Owen, D. B., Tables for computing bivariate normal probabilities, The
+           Annals of Mathematical Statistics 27(4), 1956
+    """
+    # Large arguments are clipped, where the cdf is saturated, to avoid undefined
+    # expressions. Adding zero maps negative zeros to positive zeros.
+    h = np.clip(h, -40.0, 40.0) + 0.0
+    k = np.clip(k, -40.0, 40.0) + 0.0
+
+    sqrt_one_minus_rho_sq = np.sqrt(1.0 - rho * rho)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        owens_t_h = scipy.special.owens_t(
+            h, (k - rho * h) / (h * sqrt_one_minus_rho_sq)
+        )
+        owens_t_k = scipy.special.owens_t(
+            k, (h - rho * k) / (k * sqrt_one_minus_rho_sq)
+        )
+
+    cdf = (
+        0.5 * (scipy.special.ndtr(h) + scipy.special.ndtr(k))
+        - owens_t_h
+        - owens_t_k
+        - 0.5 * ((h * k < 0) | ((h * k == 0) & (h + k < 0)))
+    )
+
+    cdf = np.where((h == 0) & (k == 0), 0.25 + np.arcsin(rho) / (2.0 * np.pi), cdf)
+
+    # Cancellation can lead to tiny negative values in the lower tail
+    return np.clip(cdf, 0.0, 1.0)
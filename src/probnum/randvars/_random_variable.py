@@ -1,5 +1,6 @@
 """Random Variables."""
 
+import math
 from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar, Union
 
 import numpy as np
@@ -291,6 +292,9 @@ class RandomVariable(Generic[_ValueType]):
                 "The median is only defined for scalar random variables."
             )
 
+        if self.__median is None:
+            raise NotImplementedError
+
         median = self.__median()
 
         RandomVariable._check_property_value(
@@ -391,9 +395,15 @@ class RandomVariable(Generic[_ValueType]):
         """
         if self.__std is None:
             try:
-                std = np.sqrt(self.var)
+                var = self.var
             except NotImplementedError as exc:
                 raise NotImplementedError from exc
+
+            if isinstance(var, np.float_) and var >= 0:
+                # Avoid the overhead of the ufunc machinery for scalar variances
+                std = np.float_(math.sqrt(var))
+            else:
+                std = np.sqrt(var)
         else:
             std = self.__std()
 
@@ -475,11 +485,9 @@ class RandomVariable(Generic[_ValueType]):
                 "cdf", self.__cdf(self._as_value_type(x))
             )
         elif self.__logcdf is not None:
-            cdf = np.exp(self.logcdf(self._as_value_type(x)))
-
-            assert isinstance(cdf, np.float_)
-
-            return cdf
+            return RandomVariable._ensure_numpy_float(
+                "cdf", np.exp(self.__logcdf(self._as_value_type(x)))
+            )
         else:
             raise NotImplementedError(
                 f"Neither the `cdf` nor the `logcdf` of the random variable object "
@@ -502,11 +510,9 @@ class RandomVariable(Generic[_ValueType]):
                 "logcdf", self.__logcdf(self._as_value_type(x))
             )
         elif self.__cdf is not None:
-            logcdf = np.log(self.__cdf(x))
-
-            assert isinstance(logcdf, np.float_)
-
-            return logcdf
+            return RandomVariable._ensure_numpy_float(
+                "logcdf", np.log(self.__cdf(self._as_value_type(x)))
+            )
         else:
             raise NotImplementedError(
                 f"Neither the `logcdf` nor the `cdf` of the random variable object "
@@ -628,36 +634,10 @@ class RandomVariable(Generic[_ValueType]):
     # Unary arithmetic operations
 
     def __neg__(self) -> "RandomVariable":
-        return RandomVariable(
-            shape=self.shape,
-            dtype=self.dtype,
-            random_state=_utils.derive_random_seed(self.random_state),
-            sample=lambda size: -self.sample(size=size),
-            in_support=lambda x: self.in_support(-x),
-            mode=lambda: -self.mode,
-            median=lambda: -self.median,
-            mean=lambda: -self.mean,
-            cov=lambda: self.cov,
-            var=lambda: self.var,
-            std=lambda: self.std,
-            as_value_type=self.__as_value_type,
-        )
+        return _arithmetic.neg(self)
 
     def __pos__(self) -> "RandomVariable":
-        return RandomVariable(
-            shape=self.shape,
-            dtype=self.dtype,
-            random_state=_utils.derive_random_seed(self.random_state),
-            sample=lambda size: +self.sample(size=size),
-            in_support=lambda x: self.in_support(+x),
-            mode=lambda: +self.mode,
-            median=lambda: +self.median,
-            mean=lambda: +self.mean,
-            cov=lambda: self.cov,
-            var=lambda: self.var,
-            std=lambda: self.std,
-            as_value_type=self.__as_value_type,
-        )
+        return _arithmetic.pos(self)
 
     def __abs__(self) -> "RandomVariable":
         return RandomVariable(
@@ -679,112 +659,58 @@ class RandomVariable(Generic[_ValueType]):
     """
 
     def __add__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import add
-
-        return add(self, other)
+        return _arithmetic.add(self, other)
 
     def __radd__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import add
-
-        return add(other, self)
+        return _arithmetic.add(other, self)
 
     def __sub__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import sub
-
-        return sub(self, other)
+        return _arithmetic.sub(self, other)
 
     def __rsub__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import sub
-
-        return sub(other, self)
+        return _arithmetic.sub(other, self)
 
     def __mul__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import mul
-
-        return mul(self, other)
+        return _arithmetic.mul(self, other)
 
     def __rmul__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import mul
-
-        return mul(other, self)
+        return _arithmetic.mul(other, self)
 
     def __matmul__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import matmul
-
-        return matmul(self, other)
+        return _arithmetic.matmul(self, other)
 
     def __rmatmul__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import matmul
-
-        return matmul(other, self)
+        return _arithmetic.matmul(other, self)
 
     def __truediv__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import truediv
-
-        return truediv(self, other)
+        return _arithmetic.truediv(self, other)
 
     def __rtruediv__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import truediv
-
-        return truediv(other, self)
+        return _arithmetic.truediv(other, self)
 
     def __floordiv__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import floordiv
-
-        return floordiv(self, other)
+        return _arithmetic.floordiv(self, other)
 
     def __rfloordiv__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import floordiv
-
-        return floordiv(other, self)
+        return _arithmetic.floordiv(other, self)
 
     def __mod__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import mod
-
-        return mod(self, other)
+        return _arithmetic.mod(self, other)
 
     def __rmod__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import mod
-
-        return mod(other, self)
+        return _arithmetic.mod(other, self)
 
     def __divmod__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import divmod_
-
-        return divmod_(self, other)
+        return _arithmetic.divmod_(self, other)
 
     def __rdivmod__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import divmod_
-
-        return divmod_(other, self)
+        return _arithmetic.divmod_(other, self)
 
     def __pow__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import pow_
-
-        return pow_(self, other)
+        return _arithmetic.pow_(self, other)
 
     def __rpow__(self, other: Any) -> "RandomVariable":
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from ._arithmetic import pow_
-
-        return pow_(other, self)
+        return _arithmetic.pow_(other, self)
 
     @staticmethod
     def infer_median_dtype(value_dtype: DTypeArgType) -> np.dtype:
@@ -1069,13 +995,13 @@ class DiscreteRandomVariable(RandomVariable[_ValueType]):
             The pmf evaluation will be broadcast over all additional dimensions.
         """
         if self.__pmf is not None:
-            return DiscreteRandomVariable._ensure_numpy_float("pmf", self.__pmf(x))
+            return DiscreteRandomVariable._ensure_numpy_float(
+                "pmf", self.__pmf(self._as_value_type(x))
+            )
         elif self.__logpmf is not None:
-            pmf = np.exp(self.__logpmf(x))
-
-            assert isinstance(pmf, np.float_)
-
-            return pmf
+            return DiscreteRandomVariable._ensure_numpy_float(
+                "pmf", np.exp(self.__logpmf(self._as_value_type(x)))
+            )
         else:
             raise NotImplementedError(
                 f"Neither the `pmf` nor the `logpmf` of the discrete random variable "
@@ -1098,11 +1024,9 @@ class DiscreteRandomVariable(RandomVariable[_ValueType]):
                 "logpmf", self.__logpmf(self._as_value_type(x))
             )
         elif self.__pmf is not None:
-            logpmf = np.log(self.__pmf(self._as_value_type(x)))
-
-            assert isinstance(logpmf, np.float_)
-
-            return logpmf
+            return DiscreteRandomVariable._ensure_numpy_float(
+                "logpmf", np.log(self.__pmf(self._as_value_type(x)))
+            )
         else:
             raise NotImplementedError(
                 f"Neither the `logpmf` nor the `pmf` of the discrete random variable "
@@ -1250,6 +1174,10 @@ class ContinuousRandomVariable(RandomVariable[_ValueType]):
         self.__pdf = pdf
         self.__logpdf = logpdf
 
+        if median is None and quantile is not None:
+            # The median of a continuous random variable is its 0.5-quantile
+            median = lambda: np.asarray(self.quantile(0.5), dtype=self.median_dtype)[()]
+
         super().__init__(
             shape=shape,
             dtype=dtype,
@@ -1295,11 +1223,9 @@ class ContinuousRandomVariable(RandomVariable[_ValueType]):
                 "pdf", self.__pdf(self._as_value_type(x))
             )
         if self.__logpdf is not None:
-            pdf = np.exp(self.__logpdf(self._as_value_type(x)))
-
-            assert isinstance(pdf, np.float_)
-
-            return pdf
+            return ContinuousRandomVariable._ensure_numpy_float(
+                "pdf", np.exp(self.__logpdf(self._as_value_type(x)))
+            )
         raise NotImplementedError(
             f"Neither the `pdf` nor the `logpdf` of the continuous random variable "
             f"object with type `{type(self).__name__}` is implemented."
@@ -1321,13 +1247,17 @@ class ContinuousRandomVariable(RandomVariable[_ValueType]):
                 "logpdf", self.__logpdf(self._as_value_type(x))
             )
         elif self.__pdf is not None:
-            logpdf = np.log(self.__pdf(self._as_value_type(x)))
-
-            assert isinstance(logpdf, np.float_)
-
-            return logpdf
+            return ContinuousRandomVariable._ensure_numpy_float(
+                "logpdf", np.log(self.__pdf(self._as_value_type(x)))
+            )
         else:
             raise NotImplementedError(
                 f"Neither the `logpdf` nor the `pdf` of the continuous random variable "
                 f"object with type `{type(self).__name__}` is implemented."
             )
+
+
+# The arithmetic operators are implemented in a separate module, which depends on the
+# subclasses of `RandomVariable`. It is imported once after all classes in this module
+# are defined, instead of on every call of an arithmetic operator.
+from . import _arithmetic  # pylint: disable=wrong-import-position,cyclic-import
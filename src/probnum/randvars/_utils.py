@@ -37,6 +37,10 @@ def asrandvar(obj: Any) -> _random_variable.RandomVariable:
 
     # pylint: disable=protected-access
 
+    # Scalars and arrays are the most common arguments, so they are checked first
+    if isinstance(obj, (int, float, complex, np.generic, np.ndarray)):
+        return _constant.Constant(support=obj)
+
     # RandomVariable
     if isinstance(obj, _random_variable.RandomVariable):
         return obj
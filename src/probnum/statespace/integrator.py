@@ -16,6 +16,7 @@ from probnum import randvars
 
 from . import discrete_transition, sde
 from .preconditioner import NordsieckLikeCoordinates
+from .sde_utils import matrix_fraction_decomposition
 
 
 class Integrator:
@@ -48,12 +49,77 @@ class Integrator:
         Returns
         -------
         np.ndarray, shape=(d, d*(q+1))
-            Projection matrix :math:`H_i`.
+            Projection matrix :math:`H_i`. The matrix is cached and shared between
+            calls, and therefore read-only.
         """
-        projvec1d = np.eye(self.ordint + 1)[:, coord]
-        projmat1d = projvec1d.reshape((1, self.ordint + 1))
-        projmat = np.kron(np.eye(self.spatialdim), projmat1d)
-        return projmat
+        # Out-of-range coordinates raise an IndexError
+        return self._proj2coord_matrices[coord]
+
+    @cached_property
+    def _proj2coord_matrices(self) -> tuple:
+        """All projection matrices :math:`H_0, ..., H_q`, computed once."""
+        # The projection H_i selects index i of every (q+1)-block of the state.
+        # Viewing the stacked matrices as shape (q+1, d, d, q+1) turns this into a
+        # single scatter and avoids assembling any Kronecker product.
+        num_coords, dim = self.ordint + 1, self.spatialdim
+        projmats = np.zeros((num_coords, dim, dim * num_coords))
+        coords = np.arange(num_coords)[:, None]
+        idx = np.arange(dim)[None, :]
+        projmats.reshape((num_coords, dim, dim, num_coords))[
+            coords, idx, idx, coords
+        ] = 1.0
+        projmats.setflags(write=False)
+        return tuple(projmats)
+
+    def proj2coord_trajectory(self, means, covs, coord: int):
+        """Project a trajectory of states to the :math:`i` th coordinates.
+
+        Equivalent to applying :meth:`proj2coord` to every state in the
+        trajectory, but uses a single (batched) matrix multiplication for all
+        means and for all covariances.
+
+        Parameters
+        ----------
+        means : np.ndarray, shape=(T, d*(q+1))
+            Means of the states.
+        covs : np.ndarray, shape=(T, d*(q+1), d*(q+1))
+            Covariances of the states.
+        coord : int
+            Coordinate index :math:`i` which to project to.
+
+        Returns
+        -------
+        np.ndarray, shape=(T, d)
+            Projected means.
+        np.ndarray, shape=(T, d, d)
+            Projected covariances.
+        """
+        projmat = self.proj2coord(coord=coord)
+        projected_means = means @ projmat.T
+        projected_covs = projmat @ covs @ projmat.T
+        return projected_means, projected_covs
+
+    def proj2coords(self, state):
+        """Project a state to all coordinates at once.
+
+        Equivalent to stacking ``proj2coord(i) @ state`` for
+        :math:`i = 0, ..., q`, but computed with a single reshape of the state
+        instead of :math:`q+1` matrix-vector products.
+
+        Parameters
+        ----------
+        state : np.ndarray or randvars.RandomVariable, shape=(d*(q+1),)
+            State in coordinate-wise representation.
+
+        Returns
+        -------
+        np.ndarray or randvars.RandomVariable, shape=(q+1, d)
+            Projected state. Row :math:`i` corresponds to the :math:`i` th
+            coordinate, i.e. to ``proj2coord(i) @ state``.
+            For random variables, the cross-covariances between coordinates are
+            retained.
+        """
+        return state.reshape((self.spatialdim, self.ordint + 1)).transpose()
 
     @property
     def _derivwise2coordwise_projmat(self) -> np.ndarray:
@@ -243,17 +309,23 @@ class IBM(Integrator, sde.LTISDE):
             raise ValueError(
                 "Continuous-time transitions require a time-increment ``dt``."
             )
+        precon_diag = self.precon.diagonal(dt)
+        precon_inv_diag = self.precon.inverse.diagonal(dt)
 
-        rv = _apply_precon(self.precon.inverse(dt), rv)
+        rv = _apply_precon(precon_inv_diag, rv)
         rv, info = self.equivalent_discretisation_preconditioned.forward_rv(
             rv, t, compute_gain=compute_gain, _diffusion=_diffusion
         )
 
-        info["crosscov"] = self.precon(dt) @ info["crosscov"] @ self.precon(dt).T
+        info["crosscov"] = (
+            precon_diag[:, None] * info["crosscov"] * precon_diag[None, :]
+        )
         if "gain" in info:
-            info["gain"] = self.precon(dt) @ info["gain"] @ self.precon.inverse(dt).T
+            info["gain"] = (
+                precon_diag[:, None] * info["gain"] * precon_inv_diag[None, :]
+            )
 
-        return _apply_precon(self.precon(dt), rv), info
+        return _apply_precon(precon_diag, rv), info
 
     def backward_rv(
         self,
@@ -270,16 +342,18 @@ class IBM(Integrator, sde.LTISDE):
             raise ValueError(
                 "Continuous-time transitions require a time-increment ``dt``."
             )
+        precon_diag = self.precon.diagonal(dt)
+        precon_inv_diag = self.precon.inverse.diagonal(dt)
 
-        rv_obtained = _apply_precon(self.precon.inverse(dt), rv_obtained)
-        rv = _apply_precon(self.precon.inverse(dt), rv)
+        rv_obtained = _apply_precon(precon_inv_diag, rv_obtained)
+        rv = _apply_precon(precon_inv_diag, rv)
         rv_forwarded = (
-            _apply_precon(self.precon.inverse(dt), rv_forwarded)
+            _apply_precon(precon_inv_diag, rv_forwarded)
             if rv_forwarded is not None
             else None
         )
         gain = (
-            self.precon.inverse(dt) @ gain @ self.precon.inverse(dt).T
+            precon_inv_diag[:, None] * gain * precon_inv_diag[None, :]
             if gain is not None
             else None
         )
@@ -296,7 +370,7 @@ class IBM(Integrator, sde.LTISDE):
         # things in info in which case we want to be warned.
         assert not info
 
-        return _apply_precon(self.precon(dt), rv), info
+        return _apply_precon(precon_diag, rv), info
 
     def discretise(self, dt):
         """Equivalent discretisation of the process.
@@ -305,23 +379,26 @@ class IBM(Integrator, sde.LTISDE):
         Only present for user's convenience and to maintain a clean
         interface. Not used for forward_rv, etc..
         """
+        # The preconditioner is diagonal, so it is applied by scaling rows/columns.
+        precon_diag = self.precon.diagonal(dt)
+        precon_inv_diag = self.precon.inverse.diagonal(dt)
         state_trans_mat = (
-            self.precon(dt)
-            @ self.equivalent_discretisation_preconditioned.state_trans_mat
-            @ self.precon.inverse(dt)
+            precon_diag[:, None]
+            * self.equivalent_discretisation_preconditioned.state_trans_mat
+            * precon_inv_diag[None, :]
         )
         proc_noise_cov_mat = (
-            self.precon(dt)
-            @ self.equivalent_discretisation_preconditioned.proc_noise_cov_mat
-            @ self.precon(dt).T
+            precon_diag[:, None]
+            * self.equivalent_discretisation_preconditioned.proc_noise_cov_mat
+            * precon_diag[None, :]
         )
         zero_shift = np.zeros(len(state_trans_mat))
 
         # The Cholesky factor of the process noise covariance matrix of the IBM
         # always exists, even for non-square root implementations.
         proc_noise_cov_cholesky = (
-            self.precon(dt)
-            @ self.equivalent_discretisation_preconditioned.proc_noise_cov_cholesky
+            precon_diag[:, None]
+            * self.equivalent_discretisation_preconditioned.proc_noise_cov_cholesky
         )
 
         return discrete_transition.DiscreteLTIGaussian(
@@ -334,7 +411,52 @@ class IBM(Integrator, sde.LTISDE):
         )
 
 
-class IOUP(Integrator, sde.LTISDE):
+class _KroneckerIntegrator(Integrator, sde.LTISDE):
+    """Integrator whose drift and dispersion are of the form :math:`I_d \\otimes F`
+    and :math:`I_d \\otimes L`.
+
+    Subclasses define the one-dimensional factors ``_driftmat_1d`` and
+    ``_dispmat_1d``, from which the discretisation in the preconditioned space is
+    computed.
+    """
+
+    def __init__(
+        self,
+        ordint,
+        spatialdim,
+        forward_implementation="classic",
+        backward_implementation="classic",
+    ):
+        Integrator.__init__(self, ordint=ordint, spatialdim=spatialdim)
+        sde.LTISDE.__init__(
+            self,
+            driftmat=self._driftmat,
+            forcevec=self._forcevec,
+            dispmat=self._dispmat,
+            forward_implementation=forward_implementation,
+            backward_implementation=backward_implementation,
+        )
+
+        # Discretisations in the preconditioned space per step size. They are kept on
+        # the instance (instead of in a per-class lru_cache), so that they are freed
+        # together with the integrator.
+        self._discretisations_preconditioned = {}
+
+    def _discretise_preconditioned(self, dt):
+        discretisations = self._discretisations_preconditioned
+        if dt not in discretisations:
+            discretisations[dt] = _discretise_preconditioned_kronecker(
+                driftmat_1d=self._driftmat_1d,
+                dispmat_1d=self._dispmat_1d,
+                precon=self.precon,
+                dt=dt,
+                forward_implementation=self.forward_implementation,
+                backward_implementation=self.backward_implementation,
+            )
+        return discretisations[dt]
+
+
+class IOUP(_KroneckerIntegrator):
     """Integrated Ornstein-Uhlenbeck process in :math:`d` dimensions."""
 
     def __init__(
@@ -347,21 +469,23 @@ class IOUP(Integrator, sde.LTISDE):
     ):
         self.driftspeed = driftspeed
 
-        Integrator.__init__(self, ordint=ordint, spatialdim=spatialdim)
-        sde.LTISDE.__init__(
+        _KroneckerIntegrator.__init__(
             self,
-            driftmat=self._driftmat,
-            forcevec=self._forcevec,
-            dispmat=self._dispmat,
+            ordint=ordint,
+            spatialdim=spatialdim,
             forward_implementation=forward_implementation,
             backward_implementation=backward_implementation,
         )
 
     @cached_property
-    def _driftmat(self):
+    def _driftmat_1d(self):
         driftmat_1d = np.diag(np.ones(self.ordint), 1)
         driftmat_1d[-1, -1] = -self.driftspeed
-        return np.kron(np.eye(self.spatialdim), driftmat_1d)
+        return driftmat_1d
+
+    @cached_property
+    def _driftmat(self):
+        return np.kron(np.eye(self.spatialdim), self._driftmat_1d)
 
     @cached_property
     def _forcevec(self):
@@ -369,10 +493,14 @@ class IOUP(Integrator, sde.LTISDE):
         return np.kron(np.ones(self.spatialdim), force_1d)
 
     @cached_property
-    def _dispmat(self):
-        dispmat_1d = np.zeros(self.ordint + 1)
+    def _dispmat_1d(self):
+        dispmat_1d = np.zeros((self.ordint + 1, 1))
         dispmat_1d[-1] = 1.0  # Unit Diffusion
-        return np.kron(np.eye(self.spatialdim), dispmat_1d).T
+        return dispmat_1d
+
+    @cached_property
+    def _dispmat(self):
+        return np.kron(np.eye(self.spatialdim), self._dispmat_1d)
 
     def forward_rv(
         self,
@@ -387,30 +515,27 @@ class IOUP(Integrator, sde.LTISDE):
             raise ValueError(
                 "Continuous-time transitions require a time-increment ``dt``."
             )
+        precon_diag = self.precon.diagonal(dt)
+        precon_inv_diag = self.precon.inverse.diagonal(dt)
 
         # Fetch things into preconditioned space
-        rv = _apply_precon(self.precon.inverse(dt), rv)
-
-        # Apply preconditioning to system matrices
-        self.driftmat = self.precon.inverse(dt) @ self.driftmat @ self.precon(dt)
-        self.forcevec = self.precon.inverse(dt) @ self.forcevec
-        self.dispmat = self.precon.inverse(dt) @ self.dispmat
+        rv = _apply_precon(precon_inv_diag, rv)
 
-        # Discretise and propagate
-        discretised_model = self.discretise(dt=dt)
+        # Discretise (in the preconditioned space) and propagate
+        discretised_model = self._discretise_preconditioned(dt=dt)
         rv, info = discretised_model.forward_rv(
             rv, t, compute_gain=compute_gain, _diffusion=_diffusion
         )
 
         # Undo preconditioning and return
-        rv = _apply_precon(self.precon(dt), rv)
-        info["crosscov"] = self.precon(dt) @ info["crosscov"] @ self.precon(dt).T
+        rv = _apply_precon(precon_diag, rv)
+        info["crosscov"] = (
+            precon_diag[:, None] * info["crosscov"] * precon_diag[None, :]
+        )
         if "gain" in info:
-            info["gain"] = self.precon(dt) @ info["gain"] @ self.precon.inverse(dt).T
-
-        self.driftmat = self.precon(dt) @ self.driftmat @ self.precon.inverse(dt)
-        self.forcevec = self.precon(dt) @ self.forcevec
-        self.dispmat = self.precon(dt) @ self.dispmat
+            info["gain"] = (
+                precon_diag[:, None] * info["gain"] * precon_inv_diag[None, :]
+            )
 
         return rv, info
 
@@ -429,28 +554,25 @@ class IOUP(Integrator, sde.LTISDE):
             raise ValueError(
                 "Continuous-time transitions require a time-increment ``dt``."
             )
+        precon_diag = self.precon.diagonal(dt)
+        precon_inv_diag = self.precon.inverse.diagonal(dt)
 
         # Fetch things into preconditioned space
-        rv_obtained = _apply_precon(self.precon.inverse(dt), rv_obtained)
-        rv = _apply_precon(self.precon.inverse(dt), rv)
+        rv_obtained = _apply_precon(precon_inv_diag, rv_obtained)
+        rv = _apply_precon(precon_inv_diag, rv)
         rv_forwarded = (
-            _apply_precon(self.precon.inverse(dt), rv_forwarded)
+            _apply_precon(precon_inv_diag, rv_forwarded)
             if rv_forwarded is not None
             else None
         )
         gain = (
-            self.precon.inverse(dt) @ gain @ self.precon.inverse(dt).T
+            precon_inv_diag[:, None] * gain * precon_inv_diag[None, :]
             if gain is not None
             else None
         )
 
-        # Apply preconditioning to system matrices
-        self.driftmat = self.precon.inverse(dt) @ self.driftmat @ self.precon(dt)
-        self.forcevec = self.precon.inverse(dt) @ self.forcevec
-        self.dispmat = self.precon.inverse(dt) @ self.dispmat
-
-        # Discretise and propagate
-        discretised_model = self.discretise(dt=dt)
+        # Discretise (in the preconditioned space) and propagate
+        discretised_model = self._discretise_preconditioned(dt=dt)
         rv, info = discretised_model.backward_rv(
             rv_obtained=rv_obtained,
             rv=rv,
@@ -465,14 +587,11 @@ class IOUP(Integrator, sde.LTISDE):
         assert not info
 
         # Undo preconditioning and return
-        rv = _apply_precon(self.precon(dt), rv)
-        self.driftmat = self.precon(dt) @ self.driftmat @ self.precon.inverse(dt)
-        self.forcevec = self.precon(dt) @ self.forcevec
-        self.dispmat = self.precon(dt) @ self.dispmat
+        rv = _apply_precon(precon_diag, rv)
         return rv, info
 
 
-class Matern(Integrator, sde.LTISDE):
+class Matern(_KroneckerIntegrator):
     """Matern process in :math:`d` dimensions."""
 
     def __init__(
@@ -486,25 +605,27 @@ class Matern(Integrator, sde.LTISDE):
 
         self.lengthscale = lengthscale
 
-        Integrator.__init__(self, ordint=ordint, spatialdim=spatialdim)
-        sde.LTISDE.__init__(
+        _KroneckerIntegrator.__init__(
             self,
-            driftmat=self._driftmat,
-            forcevec=self._forcevec,
-            dispmat=self._dispmat,
+            ordint=ordint,
+            spatialdim=spatialdim,
             forward_implementation=forward_implementation,
             backward_implementation=backward_implementation,
         )
 
     @property
-    def _driftmat(self):
+    def _driftmat_1d(self):
         driftmat = np.diag(np.ones(self.ordint), 1)
         nu = self.ordint + 0.5
         D, lam = self.ordint + 1, np.sqrt(2 * nu) / self.lengthscale
         driftmat[-1, :] = np.array(
             [-scipy.special.binom(D, i) * lam ** (D - i) for i in range(D)]
         )
-        return np.kron(np.eye(self.spatialdim), driftmat)
+        return driftmat
+
+    @property
+    def _driftmat(self):
+        return np.kron(np.eye(self.spatialdim), self._driftmat_1d)
 
     @property
     def _forcevec(self):
@@ -512,10 +633,14 @@ class Matern(Integrator, sde.LTISDE):
         return np.kron(np.ones(self.spatialdim), force_1d)
 
     @property
-    def _dispmat(self):
-        dispmat_1d = np.zeros(self.ordint + 1)
+    def _dispmat_1d(self):
+        dispmat_1d = np.zeros((self.ordint + 1, 1))
         dispmat_1d[-1] = 1.0  # Unit diffusion
-        return np.kron(np.eye(self.spatialdim), dispmat_1d).T
+        return dispmat_1d
+
+    @property
+    def _dispmat(self):
+        return np.kron(np.eye(self.spatialdim), self._dispmat_1d)
 
     def forward_rv(
         self,
@@ -530,30 +655,27 @@ class Matern(Integrator, sde.LTISDE):
             raise ValueError(
                 "Continuous-time transitions require a time-increment ``dt``."
             )
+        precon_diag = self.precon.diagonal(dt)
+        precon_inv_diag = self.precon.inverse.diagonal(dt)
 
         # Fetch things into preconditioned space
-        rv = _apply_precon(self.precon.inverse(dt), rv)
+        rv = _apply_precon(precon_inv_diag, rv)
 
-        # Apply preconditioning to system matrices
-        self.driftmat = self.precon.inverse(dt) @ self.driftmat @ self.precon(dt)
-        self.forcevec = self.precon.inverse(dt) @ self.forcevec
-        self.dispmat = self.precon.inverse(dt) @ self.dispmat
-
-        # Discretise and propagate
-        discretised_model = self.discretise(dt=dt)
+        # Discretise (in the preconditioned space) and propagate
+        discretised_model = self._discretise_preconditioned(dt=dt)
         rv, info = discretised_model.forward_rv(
             rv, t, compute_gain=compute_gain, _diffusion=_diffusion
         )
 
         # Undo preconditioning and return
-        rv = _apply_precon(self.precon(dt), rv)
-        info["crosscov"] = self.precon(dt) @ info["crosscov"] @ self.precon(dt).T
+        rv = _apply_precon(precon_diag, rv)
+        info["crosscov"] = (
+            precon_diag[:, None] * info["crosscov"] * precon_diag[None, :]
+        )
         if "gain" in info:
-            info["gain"] = self.precon(dt) @ info["gain"] @ self.precon.inverse(dt).T
-
-        self.driftmat = self.precon(dt) @ self.driftmat @ self.precon.inverse(dt)
-        self.forcevec = self.precon(dt) @ self.forcevec
-        self.dispmat = self.precon(dt) @ self.dispmat
+            info["gain"] = (
+                precon_diag[:, None] * info["gain"] * precon_inv_diag[None, :]
+            )
 
         return rv, info
 
@@ -572,28 +694,25 @@ class Matern(Integrator, sde.LTISDE):
             raise ValueError(
                 "Continuous-time transitions require a time-increment ``dt``."
             )
+        precon_diag = self.precon.diagonal(dt)
+        precon_inv_diag = self.precon.inverse.diagonal(dt)
 
         # Fetch things into preconditioned space
-        rv_obtained = _apply_precon(self.precon.inverse(dt), rv_obtained)
-        rv = _apply_precon(self.precon.inverse(dt), rv)
+        rv_obtained = _apply_precon(precon_inv_diag, rv_obtained)
+        rv = _apply_precon(precon_inv_diag, rv)
         rv_forwarded = (
-            _apply_precon(self.precon.inverse(dt), rv_forwarded)
+            _apply_precon(precon_inv_diag, rv_forwarded)
             if rv_forwarded is not None
             else None
         )
         gain = (
-            self.precon.inverse(dt) @ gain @ self.precon.inverse(dt).T
+            precon_inv_diag[:, None] * gain * precon_inv_diag[None, :]
             if gain is not None
             else None
         )
 
-        # Apply preconditioning to system matrices
-        self.driftmat = self.precon.inverse(dt) @ self.driftmat @ self.precon(dt)
-        self.forcevec = self.precon.inverse(dt) @ self.forcevec
-        self.dispmat = self.precon.inverse(dt) @ self.dispmat
-
-        # Discretise and propagate
-        discretised_model = self.discretise(dt=dt)
+        # Discretise (in the preconditioned space) and propagate
+        discretised_model = self._discretise_preconditioned(dt=dt)
         rv, info = discretised_model.backward_rv(
             rv_obtained=rv_obtained,
             rv=rv,
@@ -608,14 +727,49 @@ class Matern(Integrator, sde.LTISDE):
         assert not info
 
         # Undo preconditioning and return
-        rv = _apply_precon(self.precon(dt), rv)
-        self.driftmat = self.precon(dt) @ self.driftmat @ self.precon.inverse(dt)
-        self.forcevec = self.precon(dt) @ self.forcevec
-        self.dispmat = self.precon(dt) @ self.dispmat
+        rv = _apply_precon(precon_diag, rv)
         return rv, info
 
 
-def _apply_precon(precon, rv):
+def _discretise_preconditioned_kronecker(
+    driftmat_1d,
+    dispmat_1d,
+    precon,
+    dt,
+    forward_implementation="classic",
+    backward_implementation="classic",
+):
+    """Discretise an integrator with Kronecker structure in the preconditioned space.
+
+    The drift and dispersion of IOUP and Matern processes are of the form
+    :math:`I_d \\otimes F` and :math:`I_d \\otimes L`, and so is the
+    (diagonal) preconditioner. Therefore, the discretisation is :math:`I_d
+    \\otimes A(h)` and :math:`I_d \\otimes Q(h)`, where :math:`A(h)` and
+    :math:`Q(h)` are the discretised one-dimensional matrices. This replaces a
+    matrix exponential of size :math:`2d(q+1)` by one of size :math:`2(q+1)`.
+    """
+    spatialdim = precon.spatialdim
+
+    # The preconditioner is I_d \otimes diag(scales); apply it on the 1d level.
+    scales = precon.diagonal(dt)[: len(driftmat_1d)]
+    driftmat_1d = driftmat_1d * scales[None, :] / scales[:, None]
+    dispmat_1d = dispmat_1d / scales[:, None]
+
+    ah_1d, qh_1d, _ = matrix_fraction_decomposition(driftmat_1d, dispmat_1d, dt)
+    state_trans_mat = np.kron(np.eye(spatialdim), ah_1d)
+    proc_noise_cov_mat = np.kron(np.eye(spatialdim), qh_1d)
+    zero_shift = np.zeros(len(state_trans_mat))
+
+    return discrete_transition.DiscreteLTIGaussian(
+        state_trans_mat=state_trans_mat,
+        shift_vec=zero_shift,
+        proc_noise_cov_mat=proc_noise_cov_mat,
+        forward_implementation=forward_implementation,
+        backward_implementation=backward_implementation,
+    )
+
+
+def _apply_precon(precon_diag, rv):
 
     # There is no way of checking whether `rv` has its Cholesky factor computed already or not.
     # Therefore, since we need to update the Cholesky factor for square-root filtering,
@@ -624,8 +778,10 @@ def _apply_precon(precon, rv):
     # See Issues #319 and #329.
     # When they are resolved, this function here will hopefully be superfluous.
 
-    new_mean = precon @ rv.mean
-    new_cov_cholesky = precon @ rv.cov_cholesky  # precon is diagonal, so this is valid
+    # The preconditioner is diagonal and passed as its diagonal,
+    # so applying it amounts to scaling the rows.
+    new_mean = precon_diag * rv.mean
+    new_cov_cholesky = precon_diag[:, None] * rv.cov_cholesky
     new_cov = new_cov_cholesky @ new_cov_cholesky.T
 
     return randvars.Normal(new_mean, new_cov, cov_cholesky=new_cov_cholesky)
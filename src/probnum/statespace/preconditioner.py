@@ -53,8 +53,17 @@ class NordsieckLikeCoordinates(Preconditioner):
         return cls(powers=powers + 0.5, scales=scales, spatialdim=spatialdim)
 
     def __call__(self, step):
+        return np.diag(self.diagonal(step))
+
+    def diagonal(self, step) -> np.ndarray:
+        """Diagonal of the preconditioner.
+
+        The preconditioner is a diagonal matrix, so applying it to a
+        vector or matrix amounts to a (cheap) elementwise scaling with
+        this vector.
+        """
         scaling_vector = np.abs(step) ** self.powers / self.scales
-        return np.kron(np.eye(self.spatialdim), np.diag(scaling_vector))
+        return np.tile(scaling_vector, self.spatialdim)
 
     @cached_property
     def inverse(self) -> "NordsieckLikeCoordinates":
@@ -26,13 +26,18 @@ def as_random_state(seed: RandomStateArgType) -> RandomStateType:
     seed
         If seed is None, return the RandomState singleton used by np.random. If seed is
         an int, return a new RandomState instance seeded with seed. If seed is already a
-        RandomState instance, return it.
+        RandomState or Generator instance, return it.
 
     Raises
     -------
     ValueError
         If seed is neither None, an int or a RandomState instance.
     """
+    # Fast path for the most frequent case of an existing random number generator, e.g.
+    # when a random variable is constructed from the random state of another one
+    if isinstance(seed, (np.random.RandomState, np.random.Generator)):
+        return seed
+
     return scipy._lib._util.check_random_state(seed)
 
 
@@ -44,10 +49,12 @@ def as_shape(x: ShapeArgType, ndim: Optional[numbers.Integral] = None) -> ShapeT
     x
         Shape representation.
     """
-    if isinstance(x, (int, numbers.Integral, np.integer)):
-        shape = (int(x),)
-    elif isinstance(x, tuple) and all(isinstance(item, int) for item in x):
+    # Tuples of ints, e.g. the shapes of arrays, are the most common argument. They are
+    # checked first, since the check against the abstract `numbers.Integral` is slow.
+    if isinstance(x, tuple) and all(isinstance(item, int) for item in x):
         shape = x
+    elif isinstance(x, (int, numbers.Integral, np.integer)):
+        shape = (int(x),)
     else:
         try:
             _ = iter(x)
@@ -79,7 +86,25 @@ def as_numpy_scalar(x: ScalarArgType, dtype: DTypeArgType = None) -> np.generic:
         Data type of the scalar.
     """
 
+    if dtype is None:
+        # Fast paths avoiding the construction of an intermediate array
+        if isinstance(x, np.generic):
+            return x
+
+        scalar_type = _PYTHON_SCALAR_TYPES_TO_NUMPY.get(type(x))
+
+        if scalar_type is not None:
+            return scalar_type(x)
+
     if np.ndim(x) != 0:
         raise ValueError("The given input is not a scalar.")
 
     return np.asarray(x, dtype=dtype)[()]
+
+
+# Python integers are not included, since they can exceed the range of `np.int_`
+_PYTHON_SCALAR_TYPES_TO_NUMPY = {
+    bool: np.bool_,
+    float: np.float_,
+    complex: np.complex_,
+}
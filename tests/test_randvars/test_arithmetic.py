@@ -106,6 +106,44 @@ def test_constant_normal_matrix_multiplication_left(constant, normal):
         )
 
 
+@pytest.mark.parametrize("cov_cholesky", [None, np.diag(np.sqrt(np.arange(5, 7)))])
+def test_constant_normal_matrix_multiplication_var(normal):
+    """Assert that the variance of a linear transformation of a Normal is the diagonal
+    of the transformed covariance and that it is only computed once."""
+    matrix = randvars.Constant(support=np.array([[1.0, 2.0], [-3.0, 0.5]]))
+    matrix_product = matrix @ normal
+
+    np.testing.assert_allclose(
+        matrix_product.var,
+        np.diag(matrix.support @ normal.cov @ matrix.support.T),
+    )
+    assert matrix_product.var is matrix_product.var
+
+
+@pytest.mark.parametrize("diagonal", [[2.0, -0.5], [0.0, 3.0]])
+def test_diagonal_normal_matrix_multiplication(diagonal):
+    """Assert that multiplication with a diagonal matrix matches the dense formulas
+    and yields a valid Cholesky factor."""
+    cov = np.array([[2.0, 0.6], [0.6, 1.0]])
+    normal = randvars.Normal(
+        mean=np.array([1.0, -2.0]), cov=cov, cov_cholesky=np.linalg.cholesky(cov)
+    )
+    matrix = np.diag(diagonal)
+
+    matrix_product = matrix @ normal
+
+    np.testing.assert_allclose(matrix_product.mean, matrix @ normal.mean)
+    np.testing.assert_allclose(matrix_product.cov, matrix @ cov @ matrix.T)
+    np.testing.assert_allclose(
+        matrix_product.cov_cholesky @ matrix_product.cov_cholesky.T,
+        matrix_product.cov,
+    )
+    np.testing.assert_array_equal(
+        matrix_product.cov_cholesky, np.tril(matrix_product.cov_cholesky)
+    )
+    assert np.all(np.diag(matrix_product.cov_cholesky) >= 0)
+
+
 @pytest.mark.parametrize("cov_cholesky", [None, np.diag(np.sqrt(np.arange(5, 7)))])
 def test_constant_normal_multiplication_right(constant, normal):
     """Assert that mean and covariance follow the correct formula and that a Cholesky
@@ -185,3 +223,179 @@ def test_constant_normal_division(constant, normal):
             element_product.cov_cholesky,
             normal.cov_cholesky / scalar_like_constant.support,
         )
+
+
+def test_normal_division_is_true_division():
+    """Assert that the parameters of a normal random variable are divided by a constant
+    instead of multiplied by its (rounded) reciprocal."""
+    res = randvars.Normal(49.0, 49.0 ** 2) / 49
+
+    assert res.mean == 1.0
+    assert res.cov == 1.0
+
+
+def test_generic_binary_op_does_not_sample_for_shape_inference():
+    """Assert that shape and dtype of the result of a generic binary operation are
+    inferred without drawing samples from the operands."""
+
+    def sample(size=()):
+        raise AssertionError("Operands must not be sampled on construction.")
+
+    rv1 = randvars.RandomVariable(shape=(3, 2), dtype=np.float_, sample=sample)
+    rv2 = randvars.RandomVariable(shape=(2,), dtype=np.int_, sample=sample)
+
+    for res in (rv1 + rv2, rv1 * rv2, rv1 @ rv2):
+        assert isinstance(res, randvars.RandomVariable)
+        assert res.dtype == np.float_
+
+    assert (rv1 + rv2).shape == (3, 2)
+    assert (rv1 @ rv2).shape == (3,)
+
+
+def test_generic_affine_chain_is_collapsed():
+    """Assert that a chain of shifts and scalings of a generic random variable is
+    collapsed into a single affine transformation with the correct moments."""
+    rv = randvars.RandomVariable(
+        shape=(2,),
+        dtype=np.float_,
+        random_state=1,
+        sample=lambda size: np.ones(size + (2,)),
+        mean=lambda: np.array([1.0, 2.0]),
+        cov=lambda: np.diag([3.0, 4.0]),
+    )
+
+    res = 5 - ((rv + 1) * 2 - np.array([1.0, 3.0])) * 3
+
+    assert res._base is rv
+    np.testing.assert_allclose(res.sample((3,)), np.tile([-4.0, 2.0], (3, 1)))
+    np.testing.assert_allclose(res.mean, np.array([-4.0, -4.0]))
+    np.testing.assert_allclose(res.cov, 36.0 * rv.cov)
+    np.testing.assert_allclose(res.std, 6.0 * rv.std)
+
+
+def test_generic_division_by_constant_is_affine():
+    """Assert that dividing a generic random variable by a scalar constant scales it
+    without sampling from an intermediate constant random variable."""
+    rv = randvars.RandomVariable(
+        shape=(),
+        dtype=np.int_,
+        sample=lambda size: np.full(size, 3),
+        mean=lambda: np.float_(3.0),
+    )
+
+    res = (rv - 1) / 4
+
+    assert res._base is rv
+    assert res.dtype == np.float_
+    np.testing.assert_allclose(res.sample((2,)), np.full((2,), 0.5))
+    np.testing.assert_allclose(res.mean, 0.5)
+
+
+def test_generic_division_by_constant_is_true_division():
+    """Assert that dividing a generic random variable by a constant divides instead of
+    multiplying by the (rounded) reciprocal."""
+    rv = randvars.RandomVariable(
+        shape=(),
+        dtype=np.int_,
+        sample=lambda size: np.full(size, 49),
+        mean=lambda: np.float_(49.0),
+        var=lambda: np.float_(49.0 ** 2),
+    )
+
+    res = rv / 49
+
+    np.testing.assert_array_equal(res.sample((3,)), np.ones((3,)))
+    assert res.mean == 1.0
+    assert res.var == 1.0
+    assert res.std == 1.0
+
+
+def test_generic_negation_is_affine():
+    """Assert that negating a generic random variable composes with other affine
+    operations and propagates the support."""
+    rv = randvars.RandomVariable(
+        shape=(),
+        dtype=np.int_,
+        random_state=1,
+        sample=lambda size: np.random.RandomState(1).choice([1, 2], size=size),
+        in_support=lambda x: bool(np.isin(x, [1, 2])),
+    )
+
+    res = -(2 * rv)
+
+    assert res._base is rv
+    assert res.in_support(-4)
+    assert not res.in_support(4)
+    assert np.all(np.isin(res.sample((10,)), [-2, -4]))
+
+
+@pytest.mark.parametrize(
+    "transform,expected",
+    [
+        (lambda rv: rv + 2, np.array([3, 4])),
+        (lambda rv: 3 * rv, np.array([3, 6])),
+        (lambda rv: 0.5 * rv - 1.5, np.array([-1.0, -0.5])),
+    ],
+)
+def test_generic_affine_samples(transform, expected):
+    """Assert that samples of affinely transformed random variables are correct and
+    have the inferred dtype."""
+    rv = randvars.RandomVariable(
+        shape=(2,), dtype=np.int_, sample=lambda size: np.tile([1, 2], size + (1,))
+    )
+
+    res = transform(rv)
+    samples = res.sample((3,))
+
+    assert samples.dtype == res.dtype
+    np.testing.assert_array_equal(samples, np.tile(expected, (3, 1)))
+
+
+def test_neutral_constant_operations_return_operand():
+    """Assert that adding zero to or multiplying by one returns the operand itself
+    unless the result differs in shape or dtype."""
+    normal = randvars.Normal(mean=np.zeros(2), cov=np.eye(2))
+    rv = randvars.RandomVariable(
+        shape=(2,), dtype=np.int_, sample=lambda size: np.ones(size + (2,))
+    )
+
+    for x in (normal, rv):
+        assert x + 0 is x
+        assert 0 + x is x
+        assert x - 0 is x
+        assert 1 * x is x
+        assert x * 1 is x
+
+    assert normal / 1 is normal
+    assert +rv is rv
+    assert (rv + 1) - 1 is rv
+
+    assert (rv + np.zeros((3, 2), dtype=np.int_)).shape == (3, 2)
+    assert (rv + 0.0).dtype == np.float_
+    assert (rv / 1).dtype == np.float_
+
+
+@pytest.mark.parametrize(
+    "operand", [2, 2.5, True, np.float32(1.5), np.int64(3), np.array([1.0, -2.0])]
+)
+def test_constant_operands(operand):
+    """Assert that scalars and arrays are treated as constants in arithmetic
+    operations."""
+    normal = randvars.Normal(mean=np.zeros(2), cov=np.eye(2))
+
+    np.testing.assert_array_equal((normal + operand).mean, normal.mean + operand)
+    np.testing.assert_array_equal((operand - normal).mean, operand - normal.mean)
+
+
+def test_affine_transform_keeps_value_type_conversion():
+    """Assert that shifted, scaled and negated random variables convert values like
+    the random variable they are derived from."""
+    rv = randvars.RandomVariable(
+        shape=(),
+        dtype=np.float_,
+        sample=lambda size: np.zeros(size),
+        as_value_type=lambda x: np.float_(2.0 * x),
+    )
+
+    for res in (-rv, rv + 1.0, 3.0 * rv, rv / 2.0):
+        assert res._as_value_type(1.0) == 2.0
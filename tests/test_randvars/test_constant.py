@@ -37,6 +37,50 @@ class TestConstant(unittest.TestCase):
                             tuple([sample_size, *np.shape(supp)]), np.shape(s)
                         )
 
+    def test_sample_values(self):
+        """Test whether samples equal the support and have its dtype."""
+        for supp in self.supports:
+            for sample_size in [(), 10, (3, 2)]:
+                with self.subTest():
+                    rv = randvars.Constant(support=supp)
+                    s = rv.sample(size=sample_size)
+                    self.assertEqual(s.dtype, rv.dtype)
+                    np.testing.assert_array_equal(s, np.broadcast_to(supp, np.shape(s)))
+
+    def test_samples_are_read_only_views(self):
+        """Test whether samples are read-only views of the support."""
+        rv = randvars.Constant(support=np.array([1.0, 2.0]))
+        s = rv.sample(size=(1000, 3))
+
+        self.assertFalse(s.flags.writeable)
+        self.assertTrue(np.shares_memory(s, rv.support))
+
+    def test_cdf_pmf_broadcast(self):
+        """Test whether cdf and pmf broadcast over leading batch dimensions."""
+        for supp in self.supports:
+            with self.subTest():
+                rv = randvars.Constant(support=supp)
+                x = np.stack([rv.support - 1, rv.support, rv.support + 1])
+
+                np.testing.assert_array_equal(rv.cdf(x), np.array([0.0, 1.0, 1.0]))
+                np.testing.assert_array_equal(rv.pmf(x), np.array([0.0, 1.0, 0.0]))
+                self.assertIsInstance(rv.cdf(rv.support), np.float_)
+                self.assertIsInstance(rv.pmf(rv.support), np.float_)
+
+    def test_support_is_not_aliased(self):
+        """Test whether the support is immutable without affecting the array passed
+        on construction."""
+        support = np.array([1.0, 2.0])
+        rv = randvars.Constant(support=support)
+        _ = rv.mode
+
+        self.assertTrue(support.flags.writeable)
+        self.assertFalse(rv.support.flags.writeable)
+
+        rv_sum = rv + randvars.Constant(support=np.array([1.0, 1.0]))
+        np.testing.assert_array_equal(rv.support, np.array([1.0, 2.0]))
+        np.testing.assert_array_equal(rv_sum.support, np.array([2.0, 3.0]))
+
 
 if __name__ == "__main__":
     unittest.main()
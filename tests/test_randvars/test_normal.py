@@ -127,6 +127,29 @@ class NormalTestCase(unittest.TestCase, NumpyAssertions):
         V = linops.Kronecker(A, A)
         randvars.Normal(mean=A, cov=V)
 
+    def test_kronecker_cov_var(self):
+        """Assert that the variance of a normal with Kronecker product covariance is
+        the diagonal of the dense covariance."""
+        A = random_spd_matrix(3, random_state=1)
+        B = random_spd_matrix(2, random_state=2)
+        rv = randvars.Normal(mean=np.zeros((3, 2)), cov=linops.Kronecker(A, B))
+
+        self.assertAllClose(rv.var, np.diag(np.kron(A, B)).reshape(3, 2))
+
+    def test_parameter_dtype_and_layout(self):
+        """Assert that mean and covariance are stored as C-contiguous arrays of the
+        moment dtype."""
+        cov = np.asfortranarray(random_spd_matrix(3, random_state=1))
+        for dtype in [np.int_, np.float32, np.float64]:
+            with self.subTest(dtype=dtype):
+                rv = randvars.Normal(
+                    mean=np.zeros(3, dtype=dtype), cov=cov.astype(dtype)
+                )
+
+                self.assertEqual(rv.mean.dtype, np.float64)
+                self.assertEqual(rv.cov.dtype, np.float64)
+                self.assertTrue(rv.cov.flags.c_contiguous)
+
     def test_normal_dimension_mismatch(self):
         """Instantiating a normal distribution with mismatched mean and kernels should
         result in a ValueError."""
@@ -153,9 +176,34 @@ class NormalTestCase(unittest.TestCase, NumpyAssertions):
                 dist = randvars.Normal(mean=mean, cov=cov)
                 pass
 
+    def test_univariate_pdf_logpdf(self):
+        """Compare the univariate pdf and logpdf to their SciPy counterparts."""
+        x = np.linspace(-5.0, 5.0, 11)
+        for mean, cov in [(0.0, 1.0), (-1.5, 0.25), (3, 7)]:
+            with self.subTest():
+                rv = randvars.Normal(mean=mean, cov=cov)
+                scipy_rv = scipy.stats.norm(loc=mean, scale=np.sqrt(cov))
+
+                self.assertAllClose(rv.pdf(x), scipy_rv.pdf(x), rtol=1e-12)
+                self.assertAllClose(rv.logpdf(x), scipy_rv.logpdf(x), rtol=1e-12)
+                self.assertIsInstance(rv.logpdf(0.5), np.float_)
+
     def test_normal_cdf(self):
-        """Evaluate cdf at random input."""
-        pass
+        """Compare the univariate cdf, logcdf and quantile function to their SciPy
+        counterparts."""
+        x = np.linspace(-5.0, 5.0, 11)
+        p = np.linspace(0.05, 0.95, 7)
+        for mean, cov in [(0.0, 1.0), (-1.5, 0.25), (3, 7)]:
+            with self.subTest():
+                rv = randvars.Normal(mean=mean, cov=cov)
+                scipy_rv = scipy.stats.norm(loc=mean, scale=np.sqrt(cov))
+
+                self.assertAllClose(rv.cdf(x), scipy_rv.cdf(x), rtol=1e-12)
+                self.assertAllClose(rv.logcdf(x), scipy_rv.logcdf(x), rtol=1e-12)
+                self.assertAllClose(
+                    [rv.quantile(p_i) for p_i in p], scipy_rv.ppf(p), rtol=1e-12
+                )
+                self.assertIsInstance(rv.cdf(0.5), np.float_)
 
     def test_sample(self):
         """Draw samples and check all sample dimensions."""
@@ -377,6 +425,24 @@ class UnivariateNormalTestCase(unittest.TestCase, NumpyAssertions):
     def setUp(self):
         self.params = (np.random.uniform(), np.random.gamma(shape=6, scale=1.0))
 
+    def test_sample(self):
+        """Assert that samples match those of SciPy for the same random state."""
+        mean, cov = self.params
+
+        for size in [(), (3,), (2, 4)]:
+            with self.subTest(size=size):
+                rv = randvars.Normal(mean, cov, random_state=1)
+                sample = rv.sample(size=size)
+                scipy_sample = scipy.stats.norm.rvs(
+                    loc=mean,
+                    scale=np.sqrt(cov),
+                    size=size,
+                    random_state=np.random.RandomState(1),
+                )
+
+                self.assertEqual(np.shape(sample), size)
+                self.assertAllClose(sample, scipy_sample)
+
     def test_reshape_newaxis(self):
         dist = randvars.Normal(*self.params)
 
@@ -522,6 +588,101 @@ class MultivariateNormalTestCase(unittest.TestCase, NumpyAssertions):
 
         self.assertArrayEqual(dist_t_sample, dist_sample)
 
+    def test_pdf_logpdf(self):
+        """Compare the multivariate pdf and logpdf to their SciPy counterparts."""
+        mean, cov = self.params
+        rv = randvars.Normal(mean, cov)
+        scipy_rv = scipy.stats.multivariate_normal(mean=mean, cov=cov)
+
+        x = np.random.normal(size=(4, 3, 10))
+
+        self.assertAllClose(rv.logpdf(x), scipy_rv.logpdf(x), rtol=1e-12)
+        self.assertAllClose(rv.pdf(x[0]), scipy_rv.pdf(x[0]), rtol=1e-12)
+        self.assertIsInstance(rv.logpdf(x[0, 0]), np.float_)
+
+    def test_sample_moments(self):
+        """Assert that the empirical moments of the samples match the parameters."""
+        mean, cov = self.params
+
+        for random_state in [1, np.random.default_rng(1)]:
+            with self.subTest(random_state=random_state):
+                rv = randvars.Normal(mean, cov, random_state=random_state)
+
+                samples = rv.sample(size=(50000,))
+
+                self.assertEqual(samples.shape, (50000,) + rv.shape)
+                self.assertAllClose(np.mean(samples, axis=0), mean, atol=5e-2)
+                self.assertAllClose(
+                    np.cov(samples, rowvar=False),
+                    cov,
+                    atol=5e-2 * np.max(np.abs(cov)),
+                )
+
+    def test_unary_arithmetic(self):
+        """Assert that negation preserves a precomputed Cholesky factor and that the
+        unary plus returns the random variable itself."""
+        mean, cov = self.params
+        rv = randvars.Normal(mean, cov, cov_cholesky=np.linalg.cholesky(cov))
+
+        neg_rv = -rv
+
+        self.assertArrayEqual(neg_rv.mean, -mean)
+        self.assertTrue(neg_rv.cov_cholesky_is_precomputed)
+        self.assertArrayEqual(neg_rv.cov_cholesky, rv.cov_cholesky)
+        self.assertIs(+rv, rv)
+
+    def test_bivariate_cdf(self):
+        """Compare the closed-form bivariate cdf to SciPy's numerical integration."""
+        x = np.concatenate(
+            (
+                np.random.normal(scale=2.0, size=(10, 2)),
+                [[0.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [np.inf, 0.5]],
+            )
+        )
+        for rho in [-0.95, -0.3, 0.0, 0.5, 0.99]:
+            with self.subTest(rho=rho):
+                mean = np.array([0.5, -1.0])
+                cov = np.array([[2.0, rho], [rho, 0.5]])
+                rv = randvars.Normal(mean, cov)
+
+                scipy_cdf = scipy.stats.multivariate_normal.cdf(
+                    x, mean=mean, cov=cov, abseps=1e-10, releps=1e-10
+                )
+
+                self.assertAllClose(rv.cdf(x), scipy_cdf, atol=1e-8)
+                self.assertEqual(rv.cdf(np.array([-np.inf, 1.0])), 0.0)
+                self.assertIsInstance(rv.cdf(x[0]), np.float_)
+
+    def test_pdf_logpdf_batched(self):
+        """Assert that evaluating a batch of points agrees with evaluating the points
+        one at a time."""
+        rv = randvars.Normal(*self.params)
+        x = np.random.normal(size=(7, 10))
+
+        self.assertAllClose(rv.logpdf(x), [rv.logpdf(x_i) for x_i in x], rtol=1e-12)
+        self.assertAllClose(rv.pdf(x), [rv.pdf(x_i) for x_i in x], rtol=1e-12)
+
+    def test_logpdf_singular_cov(self):
+        """Assert that the logpdf falls back to SciPy if the covariance is not
+        positive definite."""
+        rv = randvars.Normal(np.zeros(2), np.ones((2, 2)))
+
+        with self.assertRaises(np.linalg.LinAlgError):
+            rv.logpdf(np.zeros(2))
+
+    def test_pdf_logpdf_reuse_given_cov_cholesky(self):
+        """Assert that a Cholesky factor passed on construction is used to evaluate
+        the density, instead of factorizing the covariance again."""
+        mean, cov = self.params
+        cov_cholesky = np.linalg.cholesky(cov)
+        rv = randvars.Normal(mean, cov, cov_cholesky=cov_cholesky, random_state=1)
+        x = rv.sample(size=3)
+
+        self.assertAllClose(
+            rv.logpdf(x), scipy.stats.multivariate_normal.logpdf(x, mean=mean, cov=cov)
+        )
+        self.assertIs(rv._dense_cov_cholesky_factor, cov_cholesky)
+
     def test_cov_cholesky_cov_cholesky_not_passed(self):
         """No cov_cholesky is passed in init.
 
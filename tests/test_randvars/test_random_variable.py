@@ -86,6 +86,60 @@ class InstantiationTestCase(RandomVariableTestCase):
                 self.assertIsInstance(rv, randvars.RandomVariable)
 
 
+class MomentsTestCase(RandomVariableTestCase):
+    """Test moments derived from other moments of a random variable."""
+
+    def test_std_from_var(self):
+        """The standard deviation is the square root of the variance."""
+        for var in [np.float_(2.0), np.float_(0.0), np.array([1.0, 4.0])]:
+            with self.subTest():
+                rv = randvars.RandomVariable(
+                    shape=np.shape(var), dtype=np.float_, var=lambda: var
+                )
+                self.assertAllClose(rv.std, np.sqrt(var))
+                self.assertEqual(type(rv.std), type(np.sqrt(var)))
+
+    def test_median_from_quantile(self):
+        """The median of a continuous random variable is its 0.5-quantile."""
+        rv = randvars.ContinuousRandomVariable(
+            shape=(),
+            dtype=np.float_,
+            quantile=lambda p: scipy.stats.expon.ppf(p).astype(np.float_),
+        )
+        self.assertAllClose(rv.median, np.log(2.0))
+
+    def test_median_not_implemented(self):
+        """A missing median raises a NotImplementedError."""
+        rv = randvars.RandomVariable(shape=(), dtype=np.float_)
+        with self.assertRaises(NotImplementedError):
+            rv.median
+
+
+class DensityFallbackTestCase(RandomVariableTestCase):
+    """Test densities and distribution functions derived from their logarithms and
+    vice versa."""
+
+    def test_pdf_from_logpdf(self):
+        """The pdf is computed from the logpdf for single and batched inputs."""
+        rv = randvars.ContinuousRandomVariable(
+            shape=(),
+            dtype=np.float_,
+            logpdf=scipy.stats.norm.logpdf,
+            cdf=scipy.stats.norm.cdf,
+        )
+        for x in [np.float_(0.3), np.linspace(-2.0, 2.0, 5)]:
+            with self.subTest():
+                self.assertAllClose(rv.pdf(x), scipy.stats.norm.pdf(x))
+                self.assertAllClose(rv.logcdf(x), scipy.stats.norm.logcdf(x))
+
+    def test_logpmf_from_pmf(self):
+        """The logpmf of a constant is computed from its pmf."""
+        rv = randvars.Constant(support=np.array([1.0, 2.0]))
+        x = np.array([[1.0, 2.0], [0.0, 2.0]])
+        self.assertArrayEqual(rv.logpmf(x), np.array([0.0, -np.inf]))
+        self.assertIsInstance(rv.logpmf(x[0]), np.float_)
+
+
 class ArithmeticTestCase(RandomVariableTestCase):
     """Test random variable arithmetic and broadcasting."""
 
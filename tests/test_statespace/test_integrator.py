@@ -37,6 +37,63 @@ class TestIntegrator:
         e_q = self.integrator.proj2coord(coord=self.some_ordint)
         np.testing.assert_allclose(e_q, e_q_expected)
 
+    @pytest.mark.parametrize("spatialdim", [1, 3])
+    def test_proj2coord_matches_kronecker(self, spatialdim):
+        integrator = pnss.Integrator(ordint=self.some_ordint, spatialdim=spatialdim)
+        for coord in range(self.some_ordint + 1):
+            e_i = np.eye(self.some_ordint + 1)[coord].reshape((1, -1))
+            expected = np.kron(np.eye(spatialdim), e_i)
+            np.testing.assert_allclose(integrator.proj2coord(coord=coord), expected)
+
+    def test_proj2coord_cached(self):
+        e_0 = self.integrator.proj2coord(coord=0)
+        assert self.integrator.proj2coord(coord=0) is e_0
+        assert not e_0.flags.writeable
+
+    def test_proj2coord_out_of_range(self):
+        with pytest.raises(IndexError):
+            self.integrator.proj2coord(coord=self.some_ordint + 1)
+
+    @pytest.mark.parametrize("spatialdim", [1, 3])
+    def test_proj2coord_trajectory(self, spatialdim):
+        integrator = pnss.Integrator(ordint=self.some_ordint, spatialdim=spatialdim)
+        dim = spatialdim * (self.some_ordint + 1)
+        num_states = 4
+        means = np.random.rand(num_states, dim)
+        covs = np.stack([random_spd_matrix(dim) for _ in range(num_states)])
+
+        coord = self.some_ordint
+        proj = integrator.proj2coord(coord=coord)
+        projected_means, projected_covs = integrator.proj2coord_trajectory(
+            means, covs, coord=coord
+        )
+        assert projected_means.shape == (num_states, spatialdim)
+        assert projected_covs.shape == (num_states, spatialdim, spatialdim)
+        for mean, cov, projected_mean, projected_cov in zip(
+            means, covs, projected_means, projected_covs
+        ):
+            np.testing.assert_allclose(projected_mean, proj @ mean)
+            np.testing.assert_allclose(projected_cov, proj @ cov @ proj.T)
+
+    @pytest.mark.parametrize("spatialdim", [1, 3])
+    def test_proj2coords(self, spatialdim):
+        integrator = pnss.Integrator(ordint=self.some_ordint, spatialdim=spatialdim)
+        dim = spatialdim * (self.some_ordint + 1)
+        state = randvars.Normal(np.random.rand(dim), random_spd_matrix(dim))
+
+        all_coords_mean = integrator.proj2coords(state.mean)
+        all_coords_rv = integrator.proj2coords(state)
+        assert all_coords_mean.shape == (self.some_ordint + 1, spatialdim)
+        assert all_coords_rv.shape == (self.some_ordint + 1, spatialdim)
+        all_coords_cov = all_coords_rv.cov.reshape(all_coords_rv.shape * 2)
+        for coord in range(self.some_ordint + 1):
+            proj = integrator.proj2coord(coord=coord)
+            np.testing.assert_allclose(all_coords_mean[coord], proj @ state.mean)
+            np.testing.assert_allclose(all_coords_rv.mean[coord], proj @ state.mean)
+            np.testing.assert_allclose(
+                all_coords_cov[coord, :, coord, :], proj @ state.cov @ proj.T
+            )
+
     def test_precon(self):
 
         assert isinstance(self.integrator.precon, pnss.NordsieckLikeCoordinates)
@@ -204,6 +261,64 @@ def test_same_backward_outputs(both_transitions, diffusion):
     assert not info2
 
 
+@pytest.mark.parametrize(
+    "integrator",
+    [
+        pnss.IOUP(ordint=2, spatialdim=3, driftspeed=2.041),
+        pnss.Matern(ordint=2, spatialdim=3, lengthscale=2.041),
+    ],
+)
+def test_discretise_preconditioned_matches_dense(integrator):
+    """The Kronecker-structured discretisation coincides with the matrix-fraction
+    decomposition of the full (preconditioned) system matrices."""
+    dt = 0.5
+    precon, precon_inv = integrator.precon(dt), integrator.precon.inverse(dt)
+    discretised = integrator._discretise_preconditioned(dt)
+
+    # With preconditioner
+    dense_preconditioned = pnss.LTISDE(
+        precon_inv @ integrator.driftmat @ precon,
+        precon_inv @ integrator.forcevec,
+        precon_inv @ integrator.dispmat,
+    ).discretise(dt)
+    np.testing.assert_allclose(
+        discretised.state_trans_mat, dense_preconditioned.state_trans_mat, atol=1e-12
+    )
+    np.testing.assert_allclose(
+        discretised.proc_noise_cov_mat,
+        dense_preconditioned.proc_noise_cov_mat,
+        atol=1e-12,
+    )
+
+    # Without preconditioner
+    dense = pnss.LTISDE(
+        integrator.driftmat, integrator.forcevec, integrator.dispmat
+    ).discretise(dt)
+    np.testing.assert_allclose(
+        precon @ discretised.state_trans_mat @ precon_inv,
+        dense.state_trans_mat,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        precon @ discretised.proc_noise_cov_mat @ precon,
+        dense.proc_noise_cov_mat,
+        atol=1e-12,
+    )
+
+    # Propagating through the integrator matches the dense discretisation
+    rv = randvars.Normal(
+        np.arange(1.0, integrator.dimension + 1),
+        random_spd_matrix(integrator.dimension),
+    )
+    out, _ = integrator.forward_rv(rv, t=0.0, dt=dt)
+    out_dense, _ = dense.forward_rv(rv, t=0.0)
+    np.testing.assert_allclose(out.mean, out_dense.mean)
+    np.testing.assert_allclose(out.cov, out_dense.cov)
+
+    # The discretisation is cached per step size
+    assert integrator._discretise_preconditioned(dt) is discretised
+
+
 @pytest.fixture
 def dt():
     return 0.1
@@ -20,3 +20,7 @@ def test_inverse(precon):
     P, Pinv = precon(0.5), precon.inverse(0.5)
     np.testing.assert_allclose(P @ Pinv, np.eye(*P.shape))
     np.testing.assert_allclose(Pinv @ P, np.eye(*P.shape))
+
+
+def test_diagonal(precon):
+    np.testing.assert_allclose(np.diag(precon.diagonal(0.5)), precon(0.5))
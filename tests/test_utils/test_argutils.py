@@ -92,3 +92,22 @@ def test_as_shape_wrong_type(shape_arg):
 def test_as_shape_wrong_ndim(shape_arg, ndim):
     with pytest.raises(TypeError):
         pnut.as_shape(shape_arg, ndim=ndim)
+
+
+@pytest.mark.parametrize("rng", [np.random.RandomState(42), np.random.default_rng(42)])
+def test_as_random_state_returns_existing_rng(rng):
+    """Existing random number generators are passed through unchanged."""
+    assert pnut.as_random_state(rng) is rng
+
+
+@pytest.mark.parametrize("seed", [None, 42])
+def test_as_random_state_from_seed(seed):
+    assert isinstance(pnut.as_random_state(seed), np.random.RandomState)
+
+
+@pytest.mark.parametrize("scalar", [True, 1, 1.5, 1.0 - 2.0j, np.float32(1.5)])
+def test_as_numpy_scalar_dtype(scalar):
+    """The dtype of the converted scalar matches the one chosen by NumPy."""
+    as_scalar = pnut.as_numpy_scalar(scalar)
+    assert as_scalar.dtype == np.asarray(scalar).dtype
+    assert as_scalar == scalar